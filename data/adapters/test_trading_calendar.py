@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import os
 from datetime import date
 from pathlib import Path
 
 import pandas as pd
 import pytest
 
+from data.adapters import trading_calendar
 from data.adapters.trading_calendar import TradingCalendar
 
 
@@ -248,6 +250,16 @@ def test_assign_trading_date_not_implemented() -> None:
 # --- from_csv / default ---
 
 
+def test_from_csv_parses_iso_dates_to_date_objects(tmp_path: Path) -> None:
+    csv_path = tmp_path / "days.csv"
+    csv_path.write_text("trading_date\n2024-02-08\n2024-02-19\n2024-02-20\n")
+    cal = TradingCalendar.from_csv(csv_path)
+    assert len(cal) == 3
+    assert cal.first_day == date(2024, 2, 8)
+    assert type(cal.first_day) is date
+    assert cal.next_trading_day(date(2024, 2, 8)) == date(2024, 2, 19)
+
+
 @pytest.mark.skipif(
     not DEFAULT_CALENDAR_CSV.exists(),
     reason="default calendar CSV not built",
@@ -271,6 +283,33 @@ def test_default_factory_loads_bundled_csv() -> None:
     assert cal.is_trading_day(date(2024, 1, 6)) is False  # Saturday
 
 
+@pytest.mark.skipif(
+    not DEFAULT_CALENDAR_CSV.exists(),
+    reason="default calendar CSV not built",
+)
+def test_default_factory_reuses_loaded_calendar() -> None:
+    assert TradingCalendar.default() is TradingCalendar.default()
+
+
+def test_default_factory_reloads_when_csv_changes(tmp_path: Path, monkeypatch) -> None:
+    csv_path = tmp_path / "cn_futures_trading_days.csv"
+    csv_path.write_text("trading_date\n2024-01-02\n2024-01-03\n")
+    monkeypatch.setattr(trading_calendar, "DEFAULT_CALENDAR_PATH", csv_path)
+
+    first = TradingCalendar.default()
+    assert TradingCalendar.default() is first
+    assert first.last_day == date(2024, 1, 3)
+
+    csv_path.write_text("trading_date\n2024-01-02\n2024-01-03\n2024-01-04\n")
+    mtime_ns = csv_path.stat().st_mtime_ns + 1_000_000_000  # same-tick writes
+    os.utime(csv_path, ns=(mtime_ns, mtime_ns))
+
+    reloaded = TradingCalendar.default()
+    assert reloaded is not first
+    assert reloaded.last_day == date(2024, 1, 4)
+    assert TradingCalendar.default() is reloaded
+
+
 # --- regression: existing hab_bars.csv must validate cleanly ---
 
 
@@ -12,6 +12,7 @@ from __future__ import annotations
 
 import bisect
 from datetime import date, datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Iterable, Sequence, Union
 
@@ -19,6 +20,11 @@ import pandas as pd
 
 DateLike = Union[date, datetime, pd.Timestamp]
 
+DEFAULT_CALENDAR_PATH = (
+    Path(__file__).resolve().parents[2]
+    / "data" / "cache" / "calendar" / "cn_futures_trading_days.csv"
+)
+
 
 def _coerce_date(value: DateLike) -> date:
     if isinstance(value, pd.Timestamp):
@@ -69,26 +75,32 @@ class TradingCalendar:
 
     @classmethod
     def from_csv(cls, path: Path | str) -> "TradingCalendar":
-        """Load from a CSV with a single column `trading_date` (YYYY-MM-DD)."""
+        """Load from a CSV with a single column `trading_date` (YYYY-MM-DD).
+
+        The column is read as plain strings and parsed by numpy straight to
+        ``datetime64[D]``; ``astype(object)`` then yields ``datetime.date``
+        values, skipping the Timestamp-per-row round trip.
+        """
         path = Path(path)
-        df = pd.read_csv(path, parse_dates=["trading_date"])
-        return cls(df["trading_date"].tolist())
+        df = pd.read_csv(path, usecols=["trading_date"], dtype={"trading_date": str})
+        days = df["trading_date"].to_numpy(dtype=str).astype("datetime64[D]")
+        return cls(days.astype(object).tolist())
 
     @classmethod
     def default(cls) -> "TradingCalendar":
         """Load the bundled calendar at data/cache/calendar/cn_futures_trading_days.csv.
 
         Resolves the path relative to the repo root (two levels up from this
-        file), so it works regardless of CWD.
+        file), so it works regardless of CWD. The calendar is immutable, so
+        the parsed instance is shared across calls until the CSV changes.
         """
-        repo_root = Path(__file__).resolve().parents[2]
-        default_path = repo_root / "data" / "cache" / "calendar" / "cn_futures_trading_days.csv"
+        default_path = DEFAULT_CALENDAR_PATH
         if not default_path.exists():
             raise FileNotFoundError(
                 f"Default trading calendar not found at {default_path}. "
                 f"Run scripts/build_trading_calendar.py to generate it."
             )
-        return cls.from_csv(default_path)
+        return _load_calendar(cls, str(default_path), default_path.stat().st_mtime_ns)
 
     @classmethod
     def from_rqdata(cls, start: str, end: str) -> "TradingCalendar":
@@ -262,6 +274,12 @@ class TradingCalendar:
         return body
 
 
+@lru_cache(maxsize=1)
+def _load_calendar(cls: type, path: str, mtime_ns: int) -> TradingCalendar:
+    """Parse `path` once per (cls, path, mtime_ns); a rewritten CSV reloads."""
+    return cls.from_csv(path)
+
+
 def _is_nan(value: object) -> bool:
     if value is None:
         return True
@@ -19,6 +19,11 @@ from pathlib import Path
 import pandas as pd
 
 REPO_ROOT = Path(__file__).resolve().parent.parent
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from scripts.download_rqdata_futures import write_outputs
+
 HAB_BARS = REPO_ROOT / "data" / "cache" / "normalized" / "hab_bars.csv"
 SPECS_PATH = REPO_ROOT / "data" / "cache" / "commission_specs.json"
 
@@ -29,32 +34,29 @@ def main() -> int:
         return 2
 
     specs = json.loads(SPECS_PATH.read_text())
-    bars = pd.read_csv(HAB_BARS, parse_dates=["date"])
+    bars = pd.read_csv(HAB_BARS, parse_dates=["date"], date_format="ISO8601")
     old_median_by_symbol = bars.groupby("symbol")["commission"].median()
 
-    unmatched = []
-    for sym, sym_bars in bars.groupby("symbol", sort=False):
-        spec = specs.get(sym)
-        if spec is None:
-            unmatched.append(sym)
-            continue
-        rate = float(spec["rate"])
-        if spec["type"] == "by_money":
-            # Use close_raw (actual contract price, always positive) rather
-            # than Panama close which can drift negative on deep-offset symbols
-            # (I, P, LU, EC). Fall back to |close| if close_raw absent.
-            price_col = "close_raw" if "close_raw" in sym_bars.columns else "close"
-            price = sym_bars[price_col].abs()
-            bars.loc[sym_bars.index, "commission"] = (
-                rate * price * sym_bars["contract_multiplier"]
-            )
-        else:  # by_volume
-            bars.loc[sym_bars.index, "commission"] = rate
+    # Map each row to its spec once and assign the whole column in one go.
+    symbols = bars["symbol"]
+    unmatched = [sym for sym in symbols.unique() if sym not in specs]
+    rate = symbols.map({sym: float(spec["rate"]) for sym, spec in specs.items()})
+    by_money = symbols.map(
+        {sym: spec["type"] == "by_money" for sym, spec in specs.items()}
+    ).fillna(False).astype(bool)
+    # Use close_raw (actual contract price, always positive) rather than
+    # Panama close which can drift negative on deep-offset symbols
+    # (I, P, LU, EC). Fall back to |close| if close_raw absent.
+    price_col = "close_raw" if "close_raw" in bars.columns else "close"
+    commission = rate.where(~by_money, rate * bars[price_col].abs() * bars["contract_multiplier"])
+    matched = rate.notna()
+    bars.loc[matched, "commission"] = commission[matched]
 
     if unmatched:
         print(f"WARNING: no spec for {len(unmatched)} symbols, left untouched: {unmatched[:10]}...")
 
-    bars.to_csv(HAB_BARS, index=False)
+    # Rewrite the parquet sibling too so it never lags the CSV.
+    write_outputs(bars, HAB_BARS.with_suffix(""), overwrite=True, write_csv=True, write_parquet=True)
     new_median_by_symbol = bars.groupby("symbol")["commission"].median()
 
     print(f"Updated commission for {bars['symbol'].nunique() - len(unmatched)} symbols.")
@@ -29,6 +29,7 @@ if str(REPO_ROOT) not in sys.path:
 
 from data.adapters.ohlc_repair import repair_ohlc_envelope
 from data.adapters.trading_calendar import TradingCalendar
+from scripts.download_rqdata_futures import write_outputs
 
 
 HAB_BARS_CSV = REPO_ROOT / "data" / "cache" / "normalized" / "hab_bars.csv"
@@ -40,13 +41,19 @@ RAW_OHLC_COLUMNS = ["open_raw", "high_raw", "low_raw", "close_raw"]
 RAW_SETTLE_COLUMN = "settle_raw"
 CONTRACT_COLUMN = "order_book_id"
 LIMIT_COLUMNS = ["limit_up", "limit_down"]
+# Every cache CSV is written with ISO dates; naming the format skips pandas'
+# per-file format inference.
+DATE_FORMAT = "ISO8601"
+# Low-cardinality text columns repeated on every row; held as category while
+# merging (one copy of each string + small integer codes), text again on write.
+CATEGORY_COLUMNS = ["symbol", "group_name"]
 
 
 def load_raw_dominant(symbol: str) -> pd.DataFrame:
     path = DOMINANT_NONE_DIR / f"{symbol}.csv"
     if not path.exists():
         raise FileNotFoundError(f"Missing dominant_none file: {path}")
-    df = pd.read_csv(path, parse_dates=["date"])
+    df = pd.read_csv(path, parse_dates=["date"], date_format=DATE_FORMAT)
     cols = ["date", "open", "high", "low", "close"]
     rename = {
         "open": "open_raw", "high": "high_raw",
@@ -71,7 +78,7 @@ def load_contract_codes(symbol: str) -> pd.DataFrame:
             f"Missing dominant contract file: {path}. "
             f"Run scripts/download_dominant_contracts.py"
         )
-    df = pd.read_csv(path, parse_dates=["date"])
+    df = pd.read_csv(path, parse_dates=["date"], date_format=DATE_FORMAT)
     return df[["date", "order_book_id"]]
 
 
@@ -79,7 +86,7 @@ def load_limit_prices(symbol: str) -> pd.DataFrame:
     path = LIMIT_PRICES_DIR / f"{symbol}.csv"
     if not path.exists():
         return pd.DataFrame(columns=["date", "limit_up", "limit_down"])
-    df = pd.read_csv(path, parse_dates=["date"])
+    df = pd.read_csv(path, parse_dates=["date"], date_format=DATE_FORMAT)
     return df[["date", "limit_up", "limit_down"]]
 
 
@@ -88,7 +95,12 @@ def main() -> int:
         print(f"ERROR: {HAB_BARS_CSV} does not exist", file=sys.stderr)
         return 1
 
-    bars = pd.read_csv(HAB_BARS_CSV, parse_dates=["date"])
+    bars = pd.read_csv(HAB_BARS_CSV, parse_dates=["date"], date_format=DATE_FORMAT)
+    # Remember the text dtypes: the merges below may keep the category or fall
+    # back to object, so restore from these rather than from `.cat`.
+    text_dtypes = {col: bars[col].dtype for col in CATEGORY_COLUMNS if col in bars.columns}
+    for col in text_dtypes:
+        bars[col] = bars[col].astype("category")
     print(f"Loaded {HAB_BARS_CSV}: {len(bars)} rows, {bars['symbol'].nunique()} symbols")
 
     # Drop any previously-added columns (idempotent re-run).
@@ -99,7 +111,7 @@ def main() -> int:
     enriched_frames: list[pd.DataFrame] = []
     missing: list[str] = []
 
-    for symbol, sym_bars in bars.groupby("symbol", sort=False):
+    for symbol, sym_bars in bars.groupby("symbol", sort=False, observed=True):
         try:
             raw = load_raw_dominant(symbol)
             codes = load_contract_codes(symbol)
@@ -157,7 +169,20 @@ def main() -> int:
     cal = TradingCalendar.default()
     cal.validate_trading_days(enriched["date"], context="build_enhanced_bars")
 
-    enriched.to_csv(HAB_BARS_CSV, index=False)
+    for col, dtype in text_dtypes.items():
+        if col in enriched.columns:
+            enriched[col] = enriched[col].astype(dtype)
+
+    # CSV stays the canonical, diffable copy; the parquet sibling is the fast
+    # binary load path for backtests (skipped if no parquet engine installed).
+    for detail in write_outputs(
+        enriched,
+        HAB_BARS_CSV.with_suffix(""),
+        overwrite=True,
+        write_csv=True,
+        write_parquet=True,
+    ):
+        print(f"  {detail}")
     print(f"Wrote {len(enriched)} rows to {HAB_BARS_CSV}")
     print(f"New columns: {RAW_OHLC_COLUMNS + [RAW_SETTLE_COLUMN, CONTRACT_COLUMN]}")
     # Summary: count of rolls per symbol
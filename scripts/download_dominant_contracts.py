@@ -19,6 +19,7 @@ from __future__ import annotations
 import argparse
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import List
 
@@ -28,13 +29,18 @@ REPO_ROOT = Path(__file__).resolve().parent.parent
 if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
-from scripts.download_rqdata_futures import load_env_file
+from scripts.download_rqdata_futures import (
+    load_env_file,
+    plan_sidecar_update,
+    store_sidecar_frame,
+)
 
 
 DEFAULT_START = "2015-01-01"
 DEFAULT_END = "2030-12-31"
 DEFAULT_OUTPUT_DIR = REPO_ROOT / "data" / "cache" / "dominant_contracts"
 DOMINANT_NONE_DIR = REPO_ROOT / "data" / "cache" / "raw_rqdata" / "dominant_none"
+CACHE_COLUMNS = ["date", "order_book_id"]
 
 
 def parse_args() -> argparse.Namespace:
@@ -53,6 +59,19 @@ def parse_args() -> argparse.Namespace:
         help="Explicit symbol list. Default: infer from dominant_none dir.",
     )
     p.add_argument("--overwrite", action="store_true")
+    p.add_argument(
+        "--update",
+        action="store_true",
+        help="Refresh existing files incrementally: fetch only dates after the "
+        "last cached row and append them, instead of skipping the symbol.",
+    )
+    p.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Concurrent RQData requests (default 1 = serial). The calls are "
+        "network-bound, so a handful of threads cuts wall time roughly linearly.",
+    )
     return p.parse_args()
 
 
@@ -73,9 +92,9 @@ def fetch_one(
 ) -> pd.DataFrame:
     series = rqfutures.get_dominant(symbol, start_date=start, end_date=end)
     if series is None or len(series) == 0:
-        return pd.DataFrame(columns=["date", "order_book_id"])
+        return pd.DataFrame(columns=CACHE_COLUMNS)
     df = series.reset_index()
-    df.columns = ["date", "order_book_id"]
+    df.columns = CACHE_COLUMNS
     df["date"] = pd.to_datetime(df["date"])
     return df
 
@@ -94,30 +113,45 @@ def main() -> int:
     rqdatac.init(user, password)
 
     args.output_dir.mkdir(parents=True, exist_ok=True)
-    symbols = args.symbols or discover_symbols(DOMINANT_NONE_DIR)
+    # --symbols may repeat entries; fetch each underlying once, keeping order.
+    symbols = list(dict.fromkeys(args.symbols or discover_symbols(DOMINANT_NONE_DIR)))
     print(f"Fetching dominant contracts for {len(symbols)} symbols: {args.start} to {args.end}")
 
-    skipped: List[str] = []
+    plan = plan_sidecar_update(
+        symbols, args.output_dir,
+        start=args.start, end=args.end, columns=CACHE_COLUMNS,
+        overwrite=args.overwrite, update=args.update,
+        dtype={"order_book_id": str},
+    )
+    skipped: List[str] = list(plan.skipped)
     written: List[str] = []
     failed: List[str] = []
 
-    for sym in symbols:
-        out_path = args.output_dir / f"{sym}.csv"
-        if out_path.exists() and not args.overwrite:
-            skipped.append(sym)
-            continue
-        try:
-            df = fetch_one(rqfutures, sym, args.start, args.end)
-        except Exception as e:  # noqa: BLE001
-            failed.append(f"{sym}: {type(e).__name__}: {e}")
-            continue
-        if df.empty:
-            failed.append(f"{sym}: empty result")
-            continue
-        df.to_csv(out_path, index=False)
-        written.append(sym)
-
-    print(f"Written: {len(written)}; Skipped (exists): {len(skipped)}; Failed: {len(failed)}")
+    # Fetch in worker threads; CSV writes and bookkeeping stay on the main thread.
+    with ThreadPoolExecutor(max_workers=max(1, args.workers)) as pool:
+        futures = {
+            pool.submit(fetch_one, rqfutures, sym, start, args.end): sym
+            for sym, start in plan.start_by_symbol.items()
+        }
+        for future in as_completed(futures):
+            sym = futures[future]
+            try:
+                df = future.result()
+            except Exception as e:  # noqa: BLE001
+                failed.append(f"{sym}: {type(e).__name__}: {e}")
+                continue
+            status = store_sidecar_frame(
+                args.output_dir / f"{sym}.csv", df, plan.cached_by_symbol.get(sym)
+            )
+            if status == "written":
+                written.append(sym)
+            elif status == "skipped":
+                # Cache is already current: nothing new since the last row.
+                skipped.append(sym)
+            else:
+                failed.append(f"{sym}: empty result")
+
+    print(f"Written: {len(written)}; Skipped (cached): {len(skipped)}; Failed: {len(failed)}")
     if failed:
         print("Failures:")
         for f in failed:
@@ -16,7 +16,7 @@ import argparse
 import os
 import sys
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Tuple
 
 import pandas as pd
 
@@ -24,7 +24,11 @@ REPO_ROOT = Path(__file__).resolve().parent.parent
 if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
-from scripts.download_rqdata_futures import load_env_file
+from scripts.download_rqdata_futures import (
+    load_env_file,
+    plan_sidecar_update,
+    store_sidecar_frame,
+)
 
 
 DEFAULT_START = "2018-01-01"
@@ -40,6 +44,18 @@ def parse_args() -> argparse.Namespace:
     p.add_argument("--output-dir", type=Path, default=DEFAULT_OUTPUT_DIR)
     p.add_argument("--symbols", nargs="*", help="Default: all symbols in dominant_none/")
     p.add_argument("--overwrite", action="store_true")
+    p.add_argument(
+        "--update",
+        action="store_true",
+        help="Refresh existing files incrementally: fetch only dates after the "
+        "last cached row and append them, instead of skipping the symbol.",
+    )
+    p.add_argument(
+        "--batch-size",
+        type=int,
+        default=20,
+        help="Underlyings per get_dominant_price request (1 = one request per symbol).",
+    )
     return p.parse_args()
 
 
@@ -47,6 +63,22 @@ def discover_symbols() -> List[str]:
     return sorted(p.stem for p in DOMINANT_NONE_DIR.glob("*.csv"))
 
 
+LIMIT_COLUMNS = ["date", "limit_up", "limit_down"]
+
+
+def _flatten(df: pd.DataFrame) -> pd.DataFrame:
+    """MultiIndex (underlying_symbol, date) → flat (date, limit_up, limit_down).
+
+    A single-symbol response may come back indexed by date alone; the date is
+    always the last index level, so that column becomes `date`.
+    """
+    date_pos = df.index.nlevels - 1
+    df = df.reset_index()
+    if "date" not in df.columns:
+        df = df.rename(columns={df.columns[date_pos]: "date"})
+    return df
+
+
 def fetch_one(rqfutures, symbol: str, start: str, end: str) -> pd.DataFrame:
     df = rqfutures.get_dominant_price(
         underlying_symbols=symbol,
@@ -56,17 +88,72 @@ def fetch_one(rqfutures, symbol: str, start: str, end: str) -> pd.DataFrame:
         adjust_type="none",
     )
     if df is None or df.empty:
-        return pd.DataFrame(columns=["date", "limit_up", "limit_down"])
-    # MultiIndex (underlying_symbol, date) → flatten to (date, limit_up, limit_down).
-    df = df.reset_index()
-    cols = ["date", "limit_up", "limit_down"]
-    if "date" not in df.columns:
-        df = df.rename(columns={df.columns[1]: "date"})
-    df = df[cols]
+        return pd.DataFrame(columns=LIMIT_COLUMNS)
+    df = _flatten(df)[LIMIT_COLUMNS]
     df["date"] = pd.to_datetime(df["date"])
     return df
 
 
+def fetch_batch(rqfutures, symbols: List[str], start: str, end: str) -> Dict[str, pd.DataFrame]:
+    """One get_dominant_price call for several underlyings, split per symbol.
+
+    Only symbols present in the response are returned; callers decide how to
+    handle the rest.
+    """
+    df = rqfutures.get_dominant_price(
+        underlying_symbols=symbols,
+        start_date=start, end_date=end,
+        frequency="1d",
+        fields=["limit_up", "limit_down"],
+        adjust_type="none",
+    )
+    out: Dict[str, pd.DataFrame] = {}
+    if df is None or df.empty:
+        return out
+    df = _flatten(df)
+    sym_col = "underlying_symbol" if "underlying_symbol" in df.columns else df.columns[0]
+    df["date"] = pd.to_datetime(df["date"])
+    wanted = set(symbols)
+    for sym, sdf in df.groupby(sym_col, sort=False):
+        if sym in wanted:
+            out[sym] = sdf[LIMIT_COLUMNS].reset_index(drop=True)
+    return out
+
+
+def fetch_all(
+    rqfutures,
+    symbols_by_start: Dict[str, List[str]],
+    end: str,
+    batch_size: int,
+) -> Tuple[Dict[str, pd.DataFrame], List[str]]:
+    """Fetch every symbol, batching those that share a start date.
+
+    A failed batch is retried symbol by symbol so one bad underlying can't
+    sink the rest, and so is any symbol a successful batch response left out.
+    Returns (frames by symbol, failure messages).
+    """
+    fetched: Dict[str, pd.DataFrame] = {}
+    failed: List[str] = []
+    batch_size = max(1, batch_size)
+    for start, start_symbols in symbols_by_start.items():
+        for i in range(0, len(start_symbols), batch_size):
+            batch = start_symbols[i:i + batch_size]
+            try:
+                batch_result = fetch_batch(rqfutures, batch, start, end)
+            except Exception as e:  # noqa: BLE001
+                print(f"  batch {batch} failed ({type(e).__name__}: {e}); retrying per symbol")
+                batch_result = {}
+            fetched.update(batch_result)
+            for sym in batch:
+                if sym in batch_result:
+                    continue
+                try:
+                    fetched[sym] = fetch_one(rqfutures, sym, start, end)
+                except Exception as e:  # noqa: BLE001
+                    failed.append(f"{sym}: {type(e).__name__}: {e}")
+    return fetched, failed
+
+
 def main() -> int:
     args = parse_args()
     load_env_file()
@@ -81,30 +168,37 @@ def main() -> int:
     rqdatac.init(user, password)
 
     args.output_dir.mkdir(parents=True, exist_ok=True)
-    symbols = args.symbols or discover_symbols()
+    # --symbols may repeat entries; fetch each underlying once, keeping order.
+    symbols = list(dict.fromkeys(args.symbols or discover_symbols()))
     print(f"Fetching limit prices for {len(symbols)} symbols: {args.start} to {args.end}")
 
+    plan = plan_sidecar_update(
+        symbols, args.output_dir,
+        start=args.start, end=args.end, columns=LIMIT_COLUMNS,
+        overwrite=args.overwrite, update=args.update,
+    )
     written: List[str] = []
-    skipped: List[str] = []
-    failed: List[str] = []
-
-    for sym in symbols:
-        out_path = args.output_dir / f"{sym}.csv"
-        if out_path.exists() and not args.overwrite:
+    skipped: List[str] = list(plan.skipped)
+
+    symbols_by_start: Dict[str, List[str]] = {}
+    for sym, start in plan.start_by_symbol.items():
+        symbols_by_start.setdefault(start, []).append(sym)
+
+    fetched, failed = fetch_all(rqfutures, symbols_by_start, args.end, args.batch_size)
+
+    for sym, df in fetched.items():
+        status = store_sidecar_frame(
+            args.output_dir / f"{sym}.csv", df, plan.cached_by_symbol.get(sym)
+        )
+        if status == "written":
+            written.append(sym)
+        elif status == "skipped":
+            # Cache is already current: nothing new since the last row.
             skipped.append(sym)
-            continue
-        try:
-            df = fetch_one(rqfutures, sym, args.start, args.end)
-        except Exception as e:  # noqa: BLE001
-            failed.append(f"{sym}: {type(e).__name__}: {e}")
-            continue
-        if df.empty:
+        else:
             failed.append(f"{sym}: empty result")
-            continue
-        df.to_csv(out_path, index=False)
-        written.append(sym)
 
-    print(f"Written: {len(written)}; Skipped (exists): {len(skipped)}; Failed: {len(failed)}")
+    print(f"Written: {len(written)}; Skipped (cached): {len(skipped)}; Failed: {len(failed)}")
     for f in failed:
         print(f"  {f}")
     return 0 if not failed else 1
@@ -19,6 +19,7 @@ import configparser
 import json
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Sequence
@@ -71,6 +72,13 @@ class RunJobsOutcome:
     normalization_inputs: List[NormalizationInput]
 
 
+@dataclass(frozen=True)
+class SidecarPlan:
+    start_by_symbol: Dict[str, str]
+    cached_by_symbol: Dict[str, pd.DataFrame]
+    skipped: List[str]
+
+
 def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description="Download raw RQData futures history and build HAB-ready bars."
@@ -81,6 +89,12 @@ def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
         action="store_true",
         help="Overwrite existing output files instead of skipping them.",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of jobs to download concurrently (default: 1, sequential).",
+    )
     return parser.parse_args(argv)
 
 
@@ -378,7 +392,12 @@ def normalize_output_frame(df: pd.DataFrame) -> pd.DataFrame:
             out = out.rename(columns={inferred_date_col: "date"})
 
     if "date" in out.columns:
-        out["date"] = pd.to_datetime(out["date"], errors="coerce").dt.normalize()
+        dates = out["date"]
+        # Frames that already went through here carry datetime64 dates; only
+        # text/object columns need the (comparatively slow) parse.
+        if not pd.api.types.is_datetime64_any_dtype(dates):
+            dates = pd.to_datetime(dates, errors="coerce")
+        out["date"] = dates.dt.normalize()
 
     return out
 
@@ -429,7 +448,13 @@ def write_outputs(
     overwrite: bool,
     write_csv: bool,
     write_parquet: bool,
+    normalized: bool = False,
 ) -> List[str]:
+    """Write `df` to `<base_path>.csv` / `.parquet`.
+
+    Pass ``normalized=True`` when `df` is already the output of
+    ``normalize_output_frame`` so it is not copied and re-normalized.
+    """
     if not write_csv and not write_parquet:
         raise ValueError("At least one output format must be enabled.")
 
@@ -444,16 +469,17 @@ def write_outputs(
     if not overwrite and any(path.exists() for path in requested_paths):
         return [f"skip existing {path}" for path in requested_paths]
 
-    normalized = normalize_output_frame(df)
+    if not normalized:
+        df = normalize_output_frame(df)
     base_path.parent.mkdir(parents=True, exist_ok=True)
     details: List[str] = []
 
     if write_csv:
-        normalized.to_csv(csv_path, index=False)
+        df.to_csv(csv_path, index=False)
         details.append(f"wrote {csv_path}")
     if write_parquet:
         try:
-            normalized.to_parquet(parquet_path, index=False)
+            df.to_parquet(parquet_path, index=False)
             details.append(f"wrote {parquet_path}")
         except Exception as exc:
             if not is_missing_parquet_engine_error(exc):
@@ -470,6 +496,99 @@ def write_outputs(
     return details
 
 
+def upsert_by_date(cached: pd.DataFrame, new: pd.DataFrame, date_col: str = "date") -> pd.DataFrame:
+    """Merge `new` rows into `cached`, keyed on `date_col`.
+
+    Rows in `new` replace cached rows with the same date; the result is
+    sorted by date. Lets sidecar downloads fetch only the missing tail and
+    append it instead of re-downloading the whole history.
+    """
+    if cached.empty:
+        return new.sort_values(date_col, ignore_index=True)
+    if new.empty:
+        return cached
+    return (
+        pd.concat([cached, new], ignore_index=True)
+        .drop_duplicates(subset=[date_col], keep="last")
+        .sort_values(date_col, ignore_index=True)
+    )
+
+
+def read_cached(
+    path: Path,
+    columns: Sequence[str],
+    dtype: Dict[str, Any] | None = None,
+) -> pd.DataFrame:
+    """Load a previously written sidecar CSV, or an empty `columns` frame if missing."""
+    if not path.exists():
+        return pd.DataFrame(columns=list(columns))
+    df = pd.read_csv(path, dtype=dtype)
+    df["date"] = pd.to_datetime(df["date"], format="ISO8601")
+    return df
+
+
+def incremental_start(cached: pd.DataFrame, default_start: str) -> str:
+    """First date still missing from `cached` (day after its last row)."""
+    if cached.empty:
+        return default_start
+    next_day = cached["date"].max() + pd.Timedelta(days=1)
+    return max(next_day, pd.Timestamp(default_start)).strftime("%Y-%m-%d")
+
+
+def plan_sidecar_update(
+    symbols: Sequence[str],
+    output_dir: Path,
+    *,
+    start: str,
+    end: str,
+    columns: Sequence[str],
+    overwrite: bool,
+    update: bool,
+    dtype: Dict[str, Any] | None = None,
+) -> SidecarPlan:
+    """Decide which per-symbol sidecar CSVs to fetch, and from which date.
+
+    Missing files (or --overwrite) fetch from `start`. Existing files are
+    skipped unless `update`, in which case only the tail after the cached
+    last row is fetched, and the symbol is skipped if that tail starts after
+    `end`.
+    """
+    start_by_symbol: Dict[str, str] = {}
+    cached_by_symbol: Dict[str, pd.DataFrame] = {}
+    skipped: List[str] = []
+    for sym in symbols:
+        out_path = output_dir / f"{sym}.csv"
+        if not out_path.exists() or overwrite:
+            start_by_symbol[sym] = start
+        elif update:
+            cached = read_cached(out_path, columns, dtype=dtype)
+            sym_start = incremental_start(cached, start)
+            if pd.Timestamp(sym_start) > pd.Timestamp(end):
+                skipped.append(sym)
+                continue
+            cached_by_symbol[sym] = cached
+            start_by_symbol[sym] = sym_start
+        else:
+            skipped.append(sym)
+    return SidecarPlan(start_by_symbol, cached_by_symbol, skipped)
+
+
+def store_sidecar_frame(path: Path, df: pd.DataFrame, cached: pd.DataFrame | None) -> str:
+    """Write a fetched sidecar frame, merged into `cached` when updating.
+
+    Returns "written", "skipped" (an update that brought nothing new), or
+    "empty" (a fresh fetch with no rows; nothing is written).
+    """
+    if cached is not None:
+        if df.empty:
+            return "skipped"
+        df = upsert_by_date(cached, df)
+    elif df.empty:
+        return "empty"
+    df.to_csv(path, index=False)
+    return "written"
+
+
 def load_futures_instruments(reference_date: str) -> pd.DataFrame:
     if rqdatac is None:
         raise RuntimeError("rqdatac is not available.")
@@ -614,37 +733,33 @@ def discover_jobs(
     discovery: Dict[str, Any],
     instruments_df: pd.DataFrame,
 ) -> List[Dict[str, Any]]:
-    rows = instruments_df.copy()
+    # Filters only read `instruments_df`, so boolean masks are enough; no copies.
+    rows = instruments_df
     if discovery["exchanges"]:
-        rows = rows.loc[rows["exchange"].isin(discovery["exchanges"])].copy()
+        rows = rows.loc[rows["exchange"].isin(discovery["exchanges"])]
     if discovery["include_underlyings"]:
-        rows = rows.loc[
-            rows["underlying_symbol"].isin(discovery["include_underlyings"])
-        ].copy()
+        rows = rows.loc[rows["underlying_symbol"].isin(discovery["include_underlyings"])]
     if discovery["exclude_underlyings"]:
-        rows = rows.loc[
-            ~rows["underlying_symbol"].isin(discovery["exclude_underlyings"])
-        ].copy()
+        rows = rows.loc[~rows["underlying_symbol"].isin(discovery["exclude_underlyings"])]
 
     rows = rows.sort_values(["underlying_symbol", "order_book_id"]).drop_duplicates(
         subset=["underlying_symbol"],
         keep="first",
     )
 
-    jobs: List[Dict[str, Any]] = []
-    for _, row in rows.iterrows():
-        jobs.append(
-            {
-                "name": f"auto_{row['underlying_symbol'].lower()}",
-                "kind": discovery["kind"],
-                "underlying_symbol": row["underlying_symbol"],
-                "strategy_symbol": row["underlying_symbol"],
-                "variants": list(discovery["variants"]),
-                "normalize": bool(discovery["normalize"]),
-                "normalize_variant": discovery["normalize_variant"],
-            }
-        )
-    return jobs
+    variants = list(discovery["variants"])
+    return [
+        {
+            "name": f"auto_{symbol.lower()}",
+            "kind": discovery["kind"],
+            "underlying_symbol": symbol,
+            "strategy_symbol": symbol,
+            "variants": list(variants),
+            "normalize": bool(discovery["normalize"]),
+            "normalize_variant": discovery["normalize_variant"],
+        }
+        for symbol in rows["underlying_symbol"].tolist()
+    ]
 
 
 def download_contract_job(
@@ -686,8 +801,9 @@ def download_contract_job(
             ),
             None,
         )
-    normalized_df = normalize_output_frame(df)
-    if normalized_df.empty:
+    # Decide on the raw response: normalizing an empty frame only to drop it
+    # is wasted work.
+    if df.empty:
         return (
             JobResult(
                 job_label=f"contract:{order_book_id}",
@@ -696,12 +812,14 @@ def download_contract_job(
             ),
             None,
         )
+    normalized_df = normalize_output_frame(df)
     details = write_outputs(
-        df=df,
+        df=normalized_df,
         base_path=raw_output_dir / "contracts" / order_book_id,
         overwrite=overwrite,
         write_csv=write_csv,
         write_parquet=write_parquet,
+        normalized=True,
     )
     normalization_input = None
     if job.get("normalize", True):
@@ -767,12 +885,12 @@ def download_dominant_job(
                 f"skip {underlying_symbol} {variant}: no data returned by RQData"
             )
             continue
-        normalized_df = normalize_output_frame(df)
-        if normalized_df.empty:
+        if df.empty:
             details.append(
                 f"skip {underlying_symbol} {variant}: empty dataset returned by RQData"
             )
             continue
+        normalized_df = normalize_output_frame(df)
 
         had_data = True
         details.extend(
@@ -782,6 +900,7 @@ def download_dominant_job(
                 overwrite=overwrite,
                 write_csv=write_csv,
                 write_parquet=write_parquet,
+                normalized=True,
             )
         )
         if variant == normalize_variant:
@@ -856,49 +975,58 @@ def build_normalized_dataset(
     )
 
 
+def run_job(
+    job: Dict[str, Any],
+    config: Dict[str, Any],
+    overwrite: bool,
+    *,
+    instruments_df: pd.DataFrame,
+) -> tuple[JobResult, NormalizationInput | None]:
+    """Download one job; failures come back as an error JobResult."""
+    download = download_contract_job if job["kind"] == "contract" else download_dominant_job
+    try:
+        return download(
+            job,
+            start_date=config["start_date"],
+            end_date=config["end_date"],
+            frequency=config["frequency"],
+            fields=config["fields"],
+            raw_output_dir=Path(config["raw_output_dir"]),
+            overwrite=overwrite,
+            write_csv=config["write_csv"],
+            write_parquet=config["write_parquet"],
+            instruments_df=instruments_df,
+        )
+    except Exception as exc:
+        label = f"{job['kind']}:{job.get('order_book_id') or job.get('underlying_symbol')}"
+        return JobResult(job_label=label, status="error", details=[str(exc)]), None
+
+
 def run_jobs(
     config: Dict[str, Any],
     overwrite: bool,
     *,
     instruments_df: pd.DataFrame,
+    workers: int = 1,
 ) -> RunJobsOutcome:
-    raw_output_dir = Path(config["raw_output_dir"])
+    """Run every configured job, `workers` at a time.
+
+    Jobs are network-bound RQData calls, so a thread pool overlaps the round
+    trips. Results keep config order regardless of completion order.
+    """
     results: List[JobResult] = []
     normalization_inputs: List[NormalizationInput] = []
 
-    for job in config["jobs"]:
-        try:
-            if job["kind"] == "contract":
-                result, normalization_input = download_contract_job(
-                    job,
-                    start_date=config["start_date"],
-                    end_date=config["end_date"],
-                    frequency=config["frequency"],
-                    fields=config["fields"],
-                    raw_output_dir=raw_output_dir,
-                    overwrite=overwrite,
-                    write_csv=config["write_csv"],
-                    write_parquet=config["write_parquet"],
-                    instruments_df=instruments_df,
-                )
-            else:
-                result, normalization_input = download_dominant_job(
-                    job,
-                    start_date=config["start_date"],
-                    end_date=config["end_date"],
-                    frequency=config["frequency"],
-                    fields=config["fields"],
-                    raw_output_dir=raw_output_dir,
-                    overwrite=overwrite,
-                    write_csv=config["write_csv"],
-                    write_parquet=config["write_parquet"],
-                    instruments_df=instruments_df,
-                )
-        except Exception as exc:
-            label = f"{job['kind']}:{job.get('order_book_id') or job.get('underlying_symbol')}"
-            result = JobResult(job_label=label, status="error", details=[str(exc)])
-            normalization_input = None
+    def run(job: Dict[str, Any]) -> tuple[JobResult, NormalizationInput | None]:
+        return run_job(job, config, overwrite, instruments_df=instruments_df)
 
+    if workers > 1 and len(config["jobs"]) > 1:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            outcomes = list(pool.map(run, config["jobs"]))
+    else:
+        outcomes = [run(job) for job in config["jobs"]]
+
+    for result, normalization_input in outcomes:
         results.append(result)
         if normalization_input is not None:
             normalization_inputs.append(normalization_input)
@@ -923,7 +1051,12 @@ def main(argv: Sequence[str] | None = None) -> int:
 
     instruments_df = load_futures_instruments(config["discovery"]["date"])
     config = {**config, "jobs": expand_jobs(config, instruments_df)}
-    outcome = run_jobs(config=config, overwrite=overwrite, instruments_df=instruments_df)
+    outcome = run_jobs(
+        config=config,
+        overwrite=overwrite,
+        instruments_df=instruments_df,
+        workers=args.workers,
+    )
 
     try:
         normalized_details = build_normalized_dataset(
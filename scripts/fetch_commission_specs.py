@@ -36,6 +36,13 @@ def parse_args() -> argparse.Namespace:
     p = argparse.ArgumentParser(description=__doc__)
     p.add_argument("--output", type=Path, default=DEFAULT_OUTPUT)
     p.add_argument("--symbols", nargs="*", help="Default: all symbols in dominant_contracts/")
+    p.add_argument(
+        "--reuse-cache",
+        action="store_true",
+        help="Reuse the entry already in --output for a symbol whose latest local "
+        "dominant contract matches its probe_contract. Off by default: exchanges "
+        "can change fee rates mid-contract, so reused specs may be stale.",
+    )
     return p.parse_args()
 
 
@@ -50,6 +57,14 @@ def latest_contract_for_symbol(symbol: str) -> str:
     return str(df["order_book_id"].iloc[-1])
 
 
+def load_cached_specs(path: Path) -> Dict[str, Dict[str, object]]:
+    """Specs from a previous run, or {} if the file is missing or unreadable."""
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
 def main() -> int:
     args = parse_args()
     load_env_file()
@@ -65,11 +80,19 @@ def main() -> int:
     warnings.filterwarnings("ignore")
 
     symbols = args.symbols or discover_symbols()
+    cached = load_cached_specs(args.output) if args.reuse_cache else {}
     specs: Dict[str, Dict[str, object]] = {}
     failed: List[str] = []
+    reused = 0
     for sym in symbols:
         try:
             contract = latest_contract_for_symbol(sym)
+            # Same probe contract as last run → same spec; skip the request.
+            prev = cached.get(sym)
+            if prev is not None and prev.get("probe_contract") == contract:
+                specs[sym] = prev
+                reused += 1
+                continue
             df = rqfutures.get_commission_margin(contract)
             if df is None or df.empty:
                 failed.append(f"{sym}: empty")
@@ -88,7 +111,7 @@ def main() -> int:
 
     args.output.parent.mkdir(parents=True, exist_ok=True)
     args.output.write_text(json.dumps(specs, indent=2, sort_keys=True))
-    print(f"Wrote {len(specs)} symbol specs to {args.output}")
+    print(f"Wrote {len(specs)} symbol specs to {args.output} ({reused} reused from cache)")
     if failed:
         print("Failures:")
         for f in failed:
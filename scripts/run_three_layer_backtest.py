@@ -20,9 +20,10 @@ import json
 import sys
 import time
 import traceback
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, replace
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
@@ -33,7 +34,12 @@ sys.path.insert(0, str(ROOT))
 
 from strats.config_loader import load_config, build_engine_config
 from strats.engine import EngineConfig, StrategyEngine, StrategySlot
-from strats.helpers import PortfolioAnalyzer, adx as compute_adx, wilder_atr
+from strats.helpers import (
+    PortfolioAnalyzer,
+    adx as compute_adx,
+    wilder_atr,
+    win_rate_profit_factor,
+)
 
 # ── Entries ──────────────────────────────────────────────────────────────
 from strats.entries.hl_entry import HLEntryConfig, HLEntryStrategy
@@ -103,20 +109,57 @@ def make_engine_config(adx_off: bool = False, risk_overrides: dict = None) -> En
     return replace(base, **overrides)
 
 
+def read_hab_bars(csv_path: Path) -> pd.DataFrame:
+    """Read hab_bars, preferring the binary parquet sibling when it is current.
+
+    The parquet copy (written next to the CSV by build_enhanced_bars /
+    apply_commissions) loads typed columns without text parsing. It is used
+    only if it is at least as new as the CSV, and the CSV remains the fallback
+    when no parquet engine is installed or the parquet file cannot be read
+    (e.g. truncated by an interrupted write).
+    """
+    parquet_path = csv_path.with_suffix(".parquet")
+    if parquet_path.exists() and (
+        not csv_path.exists() or parquet_path.stat().st_mtime >= csv_path.stat().st_mtime
+    ):
+        try:
+            return pd.read_parquet(parquet_path)
+        except ImportError:
+            pass  # no parquet engine installed; the CSV is the normal path
+        # pyarrow's ArrowInvalid subclasses ValueError.
+        except (OSError, ValueError) as e:
+            print(f"  WARN: cannot read {parquet_path.name} ({type(e).__name__}: {e}); "
+                  f"falling back to CSV")
+    # Parse dates while reading (ISO format named, so no inference pass).
+    return pd.read_csv(csv_path, parse_dates=["date"], date_format="ISO8601")
+
+
 def load_bars() -> pd.DataFrame:
-    """Load hab_bars.csv and clamp OHLC so engine validation passes."""
+    """Load hab_bars and clamp OHLC so engine validation passes."""
     path = ROOT / "data" / "cache" / "normalized" / "hab_bars.csv"
-    bars = pd.read_csv(path)
-    bars["date"] = pd.to_datetime(bars["date"])
+    bars = read_hab_bars(path)
+    if not pd.api.types.is_datetime64_any_dtype(bars["date"]):
+        bars["date"] = pd.to_datetime(bars["date"], format="ISO8601")
     # Clamp: ensure high >= max(open,close), low <= min(open,close)
-    bars["high"] = bars[["high", "open", "close"]].max(axis=1)
-    bars["low"] = bars[["low", "open", "close"]].min(axis=1)
+    open_ = bars["open"].to_numpy(dtype=float)
+    close = bars["close"].to_numpy(dtype=float)
+    bars["high"] = np.fmax.reduce([bars["high"].to_numpy(dtype=float), open_, close])
+    bars["low"] = np.fmin.reduce([bars["low"].to_numpy(dtype=float), open_, close])
+    # Volume / open interest are whole lot counts: store them in the smallest
+    # integer dtype that holds them (columns with NaN or fractions stay as-is).
+    # Prices stay float64 — Panama-adjusted levels and P&L need the precision.
+    for col in ("volume", "open_interest"):
+        if col in bars.columns:
+            bars[col] = pd.to_numeric(bars[col], downcast="integer")
     return bars
 
 
-def filter_group(bars: pd.DataFrame, group: str) -> pd.DataFrame:
-    """Filter bars to symbols belonging to a specific group."""
-    return bars[bars["group_name"] == group].copy()
+def split_groups(bars: pd.DataFrame) -> Dict[str, pd.DataFrame]:
+    """Split bars by group_name in one pass: {group: that group's rows}.
+
+    Layers look groups up here instead of re-scanning every bar per group.
+    """
+    return {group: group_bars for group, group_bars in bars.groupby("group_name", sort=False)}
 
 
 def yearly_stats_from_trades(
@@ -144,14 +187,7 @@ def yearly_stats_from_trades(
         if n == 0:
             continue
 
-        wins = yr_trades[yr_trades["net_pnl"] > 0]
-        losses = yr_trades[yr_trades["net_pnl"] <= 0]
-        win_rate = len(wins) / n
-        pf = (
-            wins["net_pnl"].sum() / abs(losses["net_pnl"].sum())
-            if len(losses) > 0 and losses["net_pnl"].sum() != 0
-            else float("inf") if len(wins) > 0 else 0.0
-        )
+        win_rate, pf = win_rate_profit_factor(yr_trades["net_pnl"].to_numpy())
         avg_r = yr_trades["r_multiple"].mean()
 
         # Sharpe from equity curve for this year
@@ -174,8 +210,9 @@ def yearly_stats_from_trades(
                 max_dd = dd.min() if not dd.isna().all() else 0.0
 
         # Direction breakdown
-        long_trades = len(yr_trades[yr_trades["direction"] == 1])
-        short_trades = len(yr_trades[yr_trades["direction"] == -1])
+        direction = yr_trades["direction"].to_numpy()
+        long_trades = int((direction == 1).sum())
+        short_trades = int((direction == -1).sum())
 
         # Exit reason distribution
         exit_reasons = yr_trades["exit_reason"].value_counts().to_dict()
@@ -219,91 +256,130 @@ def compute_avg_adx_by_year(bars: pd.DataFrame) -> Dict[int, float]:
 # Layer 1: Strategy Layer
 # =====================================================================
 
+def _zero_row(group: str, combo_id: str, exit_reasons: str) -> Dict[str, Any]:
+    return {
+        "group": group,
+        "combo": combo_id,
+        "year": 0,
+        "trades": 0,
+        "sharpe": 0,
+        "cagr": 0,
+        "profit_factor": 0,
+        "win_rate": 0,
+        "avg_r": 0,
+        "max_dd_pct": 0,
+        "long_trades": 0,
+        "short_trades": 0,
+        "net_pnl": 0,
+        "exit_reasons": exit_reasons,
+    }
+
+
+def run_group_combos(
+    group: str,
+    group_bars: pd.DataFrame,
+    engine_cfg: EngineConfig,
+    entries: Dict[str, Any],
+    exits: Dict[str, Any],
+) -> List[Dict[str, Any]]:
+    """Run every entry x exit combo on one group's bars; returns layer-1 rows.
+
+    Self-contained (no shared state) so run_layer1 can ship it to a worker
+    process per group.
+    """
+    rows: List[Dict[str, Any]] = []
+    combos = [(eid, xid) for eid in entries for xid in exits]
+
+    # Base columns (validation, ATR/ADX) depend only on the group's bars and
+    # signals only on (bars, entry): compute the base once per group, the
+    # signals once per entry, and reuse both for every exit.
+    base_frames: Optional[List[pd.DataFrame]] = None
+    prepared_by_entry: Dict[str, pd.DataFrame] = {}
+
+    for done, (entry_id, exit_id) in enumerate(combos, start=1):
+        combo_id = f"{entry_id}+{exit_id}"
+        tag = f"[{done}/{len(combos)}] {group} / {combo_id}"
+
+        try:
+            slot = StrategySlot(
+                strategy_id=combo_id,
+                entry_strategy=entries[entry_id],
+                exit_strategy=exits[exit_id],
+            )
+            engine = StrategyEngine(config=engine_cfg, strategies=[slot])
+            if base_frames is None:
+                base_frames = engine.prepare_base(group_bars)
+            if entry_id not in prepared_by_entry:
+                prepared_by_entry[entry_id] = engine.prepare_strategies(
+                    group_bars, base_frames=base_frames,
+                )[combo_id]
+            result = engine.run(
+                group_bars,
+                prepared_by_strategy={combo_id: prepared_by_entry[entry_id]},
+            )
+
+            yr_stats = yearly_stats_from_trades(
+                result.trades,
+                result.portfolio_daily,
+                engine_cfg.initial_capital,
+            )
+
+            if not yr_stats:
+                print(f"  {tag} — 0 trades")
+                rows.append(_zero_row(group, combo_id, "{}"))
+            else:
+                for row in yr_stats:
+                    row["group"] = group
+                    row["combo"] = combo_id
+                    rows.append(row)
+                total_trades = sum(r["trades"] for r in yr_stats)
+                print(f"  {tag} — {total_trades} trades, {len(yr_stats)} years")
+
+        except Exception as e:
+            print(f"  {tag} — ERROR: {e}")
+            traceback.print_exc()
+            rows.append(_zero_row(group, combo_id, json.dumps({"ERROR": str(e)})))
+
+    return rows
+
+
 def run_layer1(
     bars: pd.DataFrame,
     engine_cfg: EngineConfig,
     entries: Dict[str, Any],
     exits: Dict[str, Any],
+    workers: int = 1,
+    bars_by_group: Optional[Dict[str, pd.DataFrame]] = None,
 ) -> pd.DataFrame:
-    """Run all combos for all groups. Returns strategy_layer DataFrame."""
-    all_rows = []
-    combos = [(eid, xid) for eid in entries for xid in exits]
-    total = len(ALL_GROUPS) * len(combos)
-    done = 0
+    """Run all combos for all groups. Returns strategy_layer DataFrame.
 
+    Groups are independent and CPU-bound, so with ``workers > 1`` each group
+    runs in its own process. Rows keep ALL_GROUPS order either way.
+    """
+    if bars_by_group is None:
+        bars_by_group = split_groups(bars)
+    group_jobs: List[Tuple[str, pd.DataFrame]] = []
     for group in ALL_GROUPS:
-        group_bars = filter_group(bars, group)
-        n_symbols = group_bars["symbol"].nunique()
-        if group_bars.empty:
+        group_bars = bars_by_group.get(group)
+        if group_bars is None or group_bars.empty:
             print(f"  [{group}] SKIP — no data")
             continue
-
-        for entry_id, exit_id in combos:
-            combo_id = f"{entry_id}+{exit_id}"
-            done += 1
-            tag = f"[{done}/{total}] {group} / {combo_id}"
-
-            try:
-                slot = StrategySlot(
-                    strategy_id=combo_id,
-                    entry_strategy=entries[entry_id],
-                    exit_strategy=exits[exit_id],
-                )
-                engine = StrategyEngine(config=engine_cfg, strategies=[slot])
-                result = engine.run(group_bars)
-
-                yr_stats = yearly_stats_from_trades(
-                    result.trades,
-                    result.portfolio_daily,
-                    engine_cfg.initial_capital,
-                )
-
-                if not yr_stats:
-                    print(f"  {tag} — 0 trades")
-                    all_rows.append({
-                        "group": group,
-                        "combo": combo_id,
-                        "year": 0,
-                        "trades": 0,
-                        "sharpe": 0,
-                        "cagr": 0,
-                        "profit_factor": 0,
-                        "win_rate": 0,
-                        "avg_r": 0,
-                        "max_dd_pct": 0,
-                        "long_trades": 0,
-                        "short_trades": 0,
-                        "net_pnl": 0,
-                        "exit_reasons": "{}",
-                    })
-                else:
-                    for row in yr_stats:
-                        row["group"] = group
-                        row["combo"] = combo_id
-                        all_rows.append(row)
-                    total_trades = sum(r["trades"] for r in yr_stats)
-                    print(f"  {tag} — {total_trades} trades, {len(yr_stats)} years")
-
-            except Exception as e:
-                print(f"  {tag} — ERROR: {e}")
-                traceback.print_exc()
-                all_rows.append({
-                    "group": group,
-                    "combo": combo_id,
-                    "year": 0,
-                    "trades": 0,
-                    "sharpe": 0,
-                    "cagr": 0,
-                    "profit_factor": 0,
-                    "win_rate": 0,
-                    "avg_r": 0,
-                    "max_dd_pct": 0,
-                    "long_trades": 0,
-                    "short_trades": 0,
-                    "net_pnl": 0,
-                    "exit_reasons": json.dumps({"ERROR": str(e)}),
-                })
-
+        group_jobs.append((group, group_bars))
+
+    rows_by_group: Dict[str, List[Dict[str, Any]]] = {}
+    if workers > 1 and len(group_jobs) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                group: pool.submit(run_group_combos, group, group_bars, engine_cfg, entries, exits)
+                for group, group_bars in group_jobs
+            }
+            for group, future in futures.items():
+                rows_by_group[group] = future.result()
+    else:
+        for group, group_bars in group_jobs:
+            rows_by_group[group] = run_group_combos(group, group_bars, engine_cfg, entries, exits)
+
+    all_rows = [row for group, _ in group_jobs for row in rows_by_group[group]]
     df = pd.DataFrame(all_rows)
     # Reorder columns
     cols = ["group", "combo", "year", "trades", "sharpe", "cagr", "profit_factor",
@@ -364,8 +440,11 @@ def run_layer2(
     entries: Dict[str, Any],
     exits: Dict[str, Any],
     layer1: pd.DataFrame,
+    bars_by_group: Optional[Dict[str, pd.DataFrame]] = None,
 ) -> Tuple[pd.DataFrame, Dict[str, str]]:
     """Run best combo per group, return group layer stats + best combo map."""
+    if bars_by_group is None:
+        bars_by_group = split_groups(bars)
     all_rows = []
     best_combos = {}
 
@@ -381,8 +460,8 @@ def run_layer2(
 
         best_combos[group] = best
         entry_id, exit_id = best.split("+")
-        group_bars = filter_group(bars, group)
-        if group_bars.empty:
+        group_bars = bars_by_group.get(group)
+        if group_bars is None or group_bars.empty:
             continue
 
         print(f"  [{group}] best combo: {best}")
@@ -565,6 +644,8 @@ def main():
     parser.add_argument("--risk-per-trade", type=float, default=None)
     parser.add_argument("--portfolio-risk-cap", type=float, default=None)
     parser.add_argument("--group-risk-cap", type=float, default=None, help="Uniform group risk cap")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Layer 1: run groups in this many processes (default 1)")
     args = parser.parse_args()
 
     adx_off = args.adx_off
@@ -604,7 +685,11 @@ def main():
     print(f"\n{'='*60}")
     print("LAYER 1: Strategy Layer (group x combo x year)")
     print(f"{'='*60}")
-    layer1 = run_layer1(bars, engine_cfg, entries, exits)
+    bars_by_group = split_groups(bars)
+    layer1 = run_layer1(
+        bars, engine_cfg, entries, exits,
+        workers=args.workers, bars_by_group=bars_by_group,
+    )
 
     out1 = ROOT / "data" / f"backtest_strategy_layer{suffix}.csv"
     layer1.to_csv(out1, index=False)
@@ -614,7 +699,9 @@ def main():
     print(f"\n{'='*60}")
     print("LAYER 2: Group Layer (best combo per group x year)")
     print(f"{'='*60}")
-    layer2, best_combos = run_layer2(bars, engine_cfg, entries, exits, layer1)
+    layer2, best_combos = run_layer2(
+        bars, engine_cfg, entries, exits, layer1, bars_by_group=bars_by_group,
+    )
 
     out2 = ROOT / "data" / f"backtest_group_layer{suffix}.csv"
     if not layer2.empty:
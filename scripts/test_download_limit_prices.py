@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+from typing import List
+
+import pandas as pd
+
+from scripts import download_limit_prices as limits
+
+
+DATES = pd.to_datetime(["2025-01-02", "2025-01-03"])
+
+
+def make_limit_frame(symbols: List[str], *, symbol_level: str = "underlying_symbol") -> pd.DataFrame:
+    index = pd.MultiIndex.from_product([symbols, DATES], names=[symbol_level, "date"])
+    n = len(index)
+    return pd.DataFrame(
+        {"limit_up": [110.0 + i for i in range(n)], "limit_down": [90.0 - i for i in range(n)]},
+        index=index,
+    )
+
+
+class FakeFutures:
+    """get_dominant_price stub: batch calls follow `batch`, single calls get a MultiIndex frame."""
+
+    def __init__(self, batch=None, omit: tuple = ()) -> None:
+        self.batch = batch
+        self.omit = set(omit)
+        self.calls = []
+
+    def get_dominant_price(self, *, underlying_symbols, **kwargs):
+        self.calls.append(underlying_symbols)
+        if isinstance(underlying_symbols, list):
+            if isinstance(self.batch, Exception):
+                raise self.batch
+            kept = [s for s in underlying_symbols if s not in self.omit]
+            return make_limit_frame(kept + ["ZZ"])  # ZZ was never requested
+        return make_limit_frame([underlying_symbols])
+
+
+def test_fetch_batch_splits_by_symbol_and_drops_unrequested() -> None:
+    out = limits.fetch_batch(FakeFutures(), ["RB", "CU"], "2025-01-01", "2025-01-31")
+
+    assert sorted(out) == ["CU", "RB"]
+    for frame in out.values():
+        assert list(frame.columns) == limits.LIMIT_COLUMNS
+        assert frame["date"].tolist() == DATES.tolist()
+    assert out["RB"]["limit_up"].tolist() == [110.0, 111.0]
+    assert out["CU"]["limit_up"].tolist() == [112.0, 113.0]
+
+
+def test_fetch_batch_falls_back_to_first_column_for_symbol() -> None:
+    class UnnamedLevel(FakeFutures):
+        def get_dominant_price(self, *, underlying_symbols, **kwargs):
+            return make_limit_frame(underlying_symbols, symbol_level="order_book_id")
+
+    out = limits.fetch_batch(UnnamedLevel(), ["RB", "CU"], "2025-01-01", "2025-01-31")
+
+    assert sorted(out) == ["CU", "RB"]
+    assert out["CU"]["limit_up"].tolist() == [112.0, 113.0]
+
+
+def test_fetch_all_retries_each_symbol_when_batch_raises(capsys) -> None:
+    fake = FakeFutures(batch=RuntimeError("quota"))
+
+    fetched, failed = limits.fetch_all(fake, {"2025-01-01": ["RB", "CU"]}, "2025-01-31", 20)
+
+    assert failed == []
+    assert sorted(fetched) == ["CU", "RB"]
+    assert fake.calls == [["RB", "CU"], "RB", "CU"]
+    assert "batch ['RB', 'CU'] failed (RuntimeError: quota)" in capsys.readouterr().out
+
+
+def test_fetch_all_retries_symbols_missing_from_batch_response() -> None:
+    fake = FakeFutures(omit=("CU",))
+
+    fetched, failed = limits.fetch_all(fake, {"2025-01-01": ["RB", "CU"]}, "2025-01-31", 20)
+
+    assert failed == []
+    assert sorted(fetched) == ["CU", "RB"]
+    assert fake.calls == [["RB", "CU"], "CU"]
+    assert fetched["CU"]["limit_up"].tolist() == [110.0, 111.0]
+
+
+def test_fetch_one_handles_date_only_index() -> None:
+    class DateIndexed(FakeFutures):
+        def get_dominant_price(self, *, underlying_symbols, **kwargs):
+            return pd.DataFrame({"limit_up": [110.0, 111.0], "limit_down": [90.0, 89.0]}, index=DATES)
+
+    df = limits.fetch_one(DateIndexed(), "RB", "2025-01-01", "2025-01-31")
+
+    assert list(df.columns) == limits.LIMIT_COLUMNS
+    assert df["date"].tolist() == DATES.tolist()
+    assert df["limit_up"].tolist() == [110.0, 111.0]
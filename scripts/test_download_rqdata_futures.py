@@ -411,6 +411,115 @@ def test_write_outputs_skips_parquet_when_engine_missing(monkeypatch, tmp_path:
     assert any("skip parquet output" in detail for detail in details)
 
 
+def test_write_outputs_does_not_renormalize_normalized_frames(monkeypatch, tmp_path: Path) -> None:
+    df = downloader.normalize_output_frame(
+        pd.DataFrame({"date": ["2025-01-02"], "close": [1.05]})
+    )
+
+    def fail_normalize(frame):
+        raise AssertionError("normalize_output_frame should not be called")
+
+    monkeypatch.setattr(downloader, "normalize_output_frame", fail_normalize)
+
+    downloader.write_outputs(
+        df=df,
+        base_path=tmp_path / "CU",
+        overwrite=True,
+        write_csv=True,
+        write_parquet=False,
+        normalized=True,
+    )
+
+    written = pd.read_csv(tmp_path / "CU.csv")
+    assert written["date"].tolist() == ["2025-01-02"]
+
+
+def test_upsert_by_date_replaces_overlap_and_appends_new_rows() -> None:
+    cached = pd.DataFrame(
+        {"date": pd.to_datetime(["2025-01-02", "2025-01-03"]), "limit_up": [10.0, 11.0]}
+    )
+    new = pd.DataFrame(
+        {"date": pd.to_datetime(["2025-01-06", "2025-01-03"]), "limit_up": [13.0, 12.0]}
+    )
+
+    merged = downloader.upsert_by_date(cached, new)
+
+    assert merged["date"].dt.strftime("%Y-%m-%d").tolist() == [
+        "2025-01-02",
+        "2025-01-03",
+        "2025-01-06",
+    ]
+    assert merged["limit_up"].tolist() == [10.0, 12.0, 13.0]
+
+
+def test_read_cached_and_incremental_start_resume_after_last_row(tmp_path: Path) -> None:
+    missing = downloader.read_cached(tmp_path / "RB.csv", ["date", "order_book_id"])
+    assert missing.empty
+    assert list(missing.columns) == ["date", "order_book_id"]
+    assert downloader.incremental_start(missing, "2018-01-01") == "2018-01-01"
+
+    path = tmp_path / "RB.csv"
+    path.write_text("date,order_book_id\n2025-01-02,0001\n2025-01-03,0001\n")
+    cached = downloader.read_cached(path, ["date", "order_book_id"], dtype={"order_book_id": str})
+
+    assert cached["order_book_id"].tolist() == ["0001", "0001"]
+    assert downloader.incremental_start(cached, "2018-01-01") == "2025-01-04"
+    assert downloader.incremental_start(cached, "2025-06-01") == "2025-06-01"
+
+
+def test_plan_sidecar_update_classifies_symbols(tmp_path: Path) -> None:
+    (tmp_path / "RB.csv").write_text("date,limit_up\n2025-01-02,10.0\n2025-01-03,11.0\n")
+    (tmp_path / "CU.csv").write_text("date,limit_up\n2025-12-31,10.0\n")
+
+    plan = downloader.plan_sidecar_update(
+        ["RB", "CU", "AU"], tmp_path,
+        start="2018-01-01", end="2025-12-31", columns=["date", "limit_up"],
+        overwrite=False, update=True,
+    )
+
+    assert plan.start_by_symbol == {"RB": "2025-01-04", "AU": "2018-01-01"}
+    assert sorted(plan.cached_by_symbol) == ["RB"]
+    assert plan.skipped == ["CU"]  # next start 2026-01-01 is past end
+
+    no_update = downloader.plan_sidecar_update(
+        ["RB", "AU"], tmp_path,
+        start="2018-01-01", end="2025-12-31", columns=["date", "limit_up"],
+        overwrite=False, update=False,
+    )
+    assert no_update.start_by_symbol == {"AU": "2018-01-01"}
+    assert no_update.skipped == ["RB"]
+
+
+def test_store_sidecar_frame_merges_overlap_into_cache(tmp_path: Path) -> None:
+    path = tmp_path / "RB.csv"
+    cached = pd.DataFrame(
+        {"date": pd.to_datetime(["2025-01-02", "2025-01-03"]), "limit_up": [10.0, 11.0]}
+    )
+    new = pd.DataFrame(
+        {"date": pd.to_datetime(["2025-01-03", "2025-01-06"]), "limit_up": [12.0, 13.0]}
+    )
+
+    assert downloader.store_sidecar_frame(path, new, cached) == "written"
+
+    written = downloader.read_cached(path, ["date", "limit_up"])
+    assert written["date"].dt.strftime("%Y-%m-%d").tolist() == [
+        "2025-01-02",
+        "2025-01-03",
+        "2025-01-06",
+    ]
+    assert written["limit_up"].tolist() == [10.0, 12.0, 13.0]
+
+
+def test_store_sidecar_frame_empty_fetch_skips_cache_but_not_fresh(tmp_path: Path) -> None:
+    empty = pd.DataFrame(columns=["date", "limit_up"])
+    cached = pd.DataFrame({"date": pd.to_datetime(["2025-01-02"]), "limit_up": [10.0]})
+
+    assert downloader.store_sidecar_frame(tmp_path / "RB.csv", empty, cached) == "skipped"
+    assert downloader.store_sidecar_frame(tmp_path / "AU.csv", empty, None) == "empty"
+    assert not (tmp_path / "RB.csv").exists()
+    assert not (tmp_path / "AU.csv").exists()
+
+
 def test_download_dominant_job_skips_when_rqdata_returns_none(monkeypatch, tmp_path: Path) -> None:
     class NoneFutures:
         def get_dominant_price(self, **kwargs):
@@ -436,6 +545,35 @@ def test_download_dominant_job_skips_when_rqdata_returns_none(monkeypatch, tmp_p
     assert any("no data returned" in detail for detail in result.details)
 
 
+def test_download_dominant_job_skips_empty_frame_before_normalizing(monkeypatch, tmp_path: Path) -> None:
+    class EmptyFutures:
+        def get_dominant_price(self, **kwargs):
+            return pd.DataFrame(columns=["open", "close"])
+
+    def fail_normalize(df):
+        raise AssertionError("empty responses should not be normalized")
+
+    monkeypatch.setattr(downloader, "rqfutures", EmptyFutures())
+    monkeypatch.setattr(downloader, "normalize_output_frame", fail_normalize)
+
+    result, normalization_input = downloader.download_dominant_job(
+        {"kind": "dominant", "underlying_symbol": "ER", "variants": ["none", "pre"]},
+        start_date="2018-01-01",
+        end_date="2026-01-01",
+        frequency="1d",
+        fields=downloader.DEFAULT_FIELDS,
+        raw_output_dir=tmp_path,
+        overwrite=True,
+        write_csv=True,
+        write_parquet=False,
+        instruments_df=make_instruments_df(),
+    )
+
+    assert result.status == "skip"
+    assert normalization_input is None
+    assert all("empty dataset" in detail for detail in result.details)
+
+
 def test_normalize_output_frame_resets_datetime_index() -> None:
     df = pd.DataFrame(
         {
@@ -566,6 +704,32 @@ def test_run_jobs_continues_after_failures(monkeypatch, tmp_path: Path) -> None:
     assert len(outcome.normalization_inputs) == 1
 
 
+def test_run_jobs_with_workers_keeps_config_order(monkeypatch, tmp_path: Path) -> None:
+    config_path = tmp_path / "config.cfg"
+    write_cfg(config_path, make_cfg(tmp_path))
+    config = downloader.load_config(config_path)
+
+    def labelled_job(kind):
+        def job(job_config, **kwargs):
+            label = f"{kind}:{job_config.get('order_book_id') or job_config.get('underlying_symbol')}"
+            return downloader.JobResult(job_label=label, status="ok", details=[]), None
+
+        return job
+
+    monkeypatch.setattr(downloader, "download_contract_job", labelled_job("contract"))
+    monkeypatch.setattr(downloader, "download_dominant_job", labelled_job("dominant"))
+
+    sequential = downloader.run_jobs(
+        config=config, overwrite=False, instruments_df=make_instruments_df()
+    )
+    threaded = downloader.run_jobs(
+        config=config, overwrite=False, instruments_df=make_instruments_df(), workers=4
+    )
+
+    assert [r.job_label for r in threaded.results] == [r.job_label for r in sequential.results]
+    assert all(r.status == "ok" for r in threaded.results)
+
+
 def test_main_builds_normalized_dataset_and_returns_zero(
     monkeypatch, tmp_path: Path, capsys
 ) -> None:
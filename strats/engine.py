@@ -13,8 +13,9 @@ from __future__ import annotations
 
 import json
 import math
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Any, Dict, FrozenSet, List, Literal, Optional, Tuple
+from typing import Any, Callable, Dict, FrozenSet, List, Literal, Optional, Tuple
 
 import numpy as np
 import pandas as pd
@@ -25,6 +26,7 @@ from strats.helpers import (
     directional_pnl,
     favorable_excursion,
     adverse_excursion,
+    format_date,
     adx as _adx,
     wilder_atr as _wilder_atr,
     rolling_last_value_percentile as _rolling_last_value_percentile,
@@ -39,6 +41,37 @@ __all__ = [
 ]
 
 
+class _SymbolIndexedDict(dict):
+    """Dict keyed by (symbol, strategy_id) with an ordered per-symbol key index.
+
+    ``keys_for(symbol)`` replaces the full scan ``[k for k in d if k[0] == symbol]``
+    the run loop did for every bar row. Only item assignment and ``del`` are
+    used on these dicts, so only those maintain the index; key order per symbol
+    matches insertion order, same as the scan.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._keys_by_symbol: Dict[str, Dict[Tuple[str, str], None]] = {}
+
+    def __setitem__(self, key: Tuple[str, str], value: Any) -> None:
+        if key not in self:
+            self._keys_by_symbol.setdefault(key[0], {})[key] = None
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key: Tuple[str, str]) -> None:
+        super().__delitem__(key)
+        symbol_keys = self._keys_by_symbol[key[0]]
+        del symbol_keys[key]
+        if not symbol_keys:
+            del self._keys_by_symbol[key[0]]
+
+    def keys_for(self, symbol: str) -> List[Tuple[str, str]]:
+        """Snapshot of keys for `symbol` (safe to delete while iterating)."""
+        symbol_keys = self._keys_by_symbol.get(symbol)
+        return list(symbol_keys) if symbol_keys else []
+
+
 
 class StrategyEngine:
     """Composable backtest engine accepting pluggable entry/exit strategies.
@@ -71,6 +104,11 @@ class StrategyEngine:
         else:
             raise ValueError("Provide either 'strategies' list or 'entry_strategy'+'exit_strategy'")
         self._strategy_map: Dict[str, StrategySlot] = {s.strategy_id: s for s in self._strategies}
+        # Bound close-phase callbacks, resolved once here rather than via
+        # slot lookup + attribute access for every position on every bar.
+        self._close_phase_by_strategy: Dict[str, Callable[..., None]] = {
+            s.strategy_id: s.exit_strategy.process_close_phase for s in self._strategies
+        }
         # Backward-compat aliases (first strategy)
         self._entry_strategy = self._strategies[0].entry_strategy
         self._exit_strategy = self._strategies[0].exit_strategy
@@ -227,10 +265,26 @@ class StrategyEngine:
         out = out.sort_values([cfg.date_col, cfg.symbol_col]).reset_index(drop=True)
         return out
 
-    def run(self, bars: pd.DataFrame) -> BacktestResult:
+    def run(
+        self,
+        bars: pd.DataFrame,
+        prepared_by_strategy: Optional[Dict[str, pd.DataFrame]] = None,
+    ) -> BacktestResult:
+        """Run the backtest on `bars`.
+
+        `prepared_by_strategy` optionally supplies the output of
+        ``prepare_strategies(bars)`` computed earlier. Parameter sweeps that
+        only vary the exit (signals depend on bars + entry strategy alone) pass
+        it to skip validation, ATR/ADX and signal preparation on every run.
+        """
         cfg = self.config
         data_quality_report = self._compute_data_quality_report(bars)
-        prepared_by_strategy = self._prepare_all_strategies(bars)
+        if prepared_by_strategy is None:
+            prepared_by_strategy = self._prepare_all_strategies(bars)
+        else:
+            missing = [s.strategy_id for s in self._strategies if s.strategy_id not in prepared_by_strategy]
+            if missing:
+                raise ValueError(f"prepared_by_strategy missing strategy ids: {missing}")
 
         # Use the first strategy's prepared data for backward compat
         # (daily_status, prepared_data in result, and date extraction)
@@ -242,18 +296,7 @@ class StrategyEngine:
                 trades=self._empty_trades_frame(),
                 daily_status=pd.DataFrame(),
                 portfolio_daily=pd.DataFrame(
-                    columns=[
-                        "date",
-                        "cash",
-                        "equity",
-                        "open_positions",
-                        "pending_entries",
-                        "open_risk",
-                        "portfolio_risk_cap",
-                        "accepted_signal_risk_today",
-                        "total_notional",
-                        "leverage",
-                    ]
+                    columns=["date", *self._PORTFOLIO_DAILY_DTYPE.names]
                 ),
                 open_positions=self._empty_open_positions_frame(),
                 prepared_data=prepared,
@@ -263,26 +306,20 @@ class StrategyEngine:
 
         dates = list(pd.Index(prepared[cfg.date_col]).drop_duplicates().sort_values())
 
-        # Pre-index rows by date for the first strategy (used for phases 1-4)
-        rows_by_date: Dict[pd.Timestamp, pd.DataFrame] = {
-            date: day_df.sort_values(cfg.symbol_col).reset_index(drop=True)
-            for date, day_df in prepared.groupby(cfg.date_col, sort=True)
+        # Pre-index rows by date per strategy (for signal generation); the
+        # first strategy's split also drives phases 1-4.
+        rows_by_date_by_strategy: Dict[str, Dict[pd.Timestamp, pd.DataFrame]] = {
+            sid: self._split_by_date(sp) for sid, sp in prepared_by_strategy.items()
         }
-
-        # Pre-index rows by date per strategy (for signal generation)
-        rows_by_date_by_strategy: Dict[str, Dict[pd.Timestamp, pd.DataFrame]] = {}
-        for sid, sp in prepared_by_strategy.items():
-            rows_by_date_by_strategy[sid] = {
-                date: day_df.sort_values(cfg.symbol_col).reset_index(drop=True)
-                for date, day_df in sp.groupby(cfg.date_col, sort=True)
-            }
+        rows_by_date: Dict[pd.Timestamp, pd.DataFrame] = rows_by_date_by_strategy[first_strategy_id]
 
         PositionKey = Tuple[str, str]  # (symbol, strategy_id)
-        positions: Dict[PositionKey, Position] = {}
-        pending_entries: Dict[PositionKey, PendingEntry] = {}
+        positions: Dict[PositionKey, Position] = _SymbolIndexedDict()
+        pending_entries: Dict[PositionKey, PendingEntry] = _SymbolIndexedDict()
         closed_trades: List[Dict[str, Any]] = []
         cancelled_entries: List[Dict[str, Any]] = []
-        portfolio_daily: List[Dict[str, Any]] = []
+        # Preallocated structured array, one record per date (filled in place).
+        portfolio_daily = np.zeros(len(dates), dtype=self._PORTFOLIO_DAILY_DTYPE)
         risk_reject: Dict[Tuple[pd.Timestamp, str, str], Optional[str]] = {}  # (date, symbol, strategy_id)
         last_close_by_symbol: Dict[str, float] = {}
         # Dual-stream raw-close tracking (populated only when enable_dual_stream).
@@ -299,18 +336,17 @@ class StrategyEngine:
         )
 
         cash = float(cfg.initial_capital)
+        close_phase_by_strategy = self._close_phase_by_strategy
 
-        for date in dates:
+        for day_idx, date in enumerate(dates):
             day_df = rows_by_date[date]
-            close_map: Dict[str, float] = {
-                str(row[cfg.symbol_col]): float(row[mark_col_effective])
-                for _, row in day_df.iterrows()
-            }
+            # Build the mark maps straight from the columns; no per-row Series.
+            day_symbols = [str(sym) for sym in day_df[cfg.symbol_col].tolist()]
+            close_map: Dict[str, float] = dict(
+                zip(day_symbols, map(float, day_df[mark_col_effective].tolist()))
+            )
             raw_close_map: Dict[str, float] = (
-                {
-                    str(row[cfg.symbol_col]): float(row[mark_raw_col_effective])
-                    for _, row in day_df.iterrows()
-                }
+                dict(zip(day_symbols, map(float, day_df[mark_raw_col_effective].tolist())))
                 if cfg.enable_dual_stream
                 else {}
             )
@@ -322,7 +358,7 @@ class StrategyEngine:
             if cfg.enable_dual_stream:
                 for _, row in day_df.iterrows():
                     symbol = str(row[cfg.symbol_col])
-                    keys_for_symbol = [k for k in positions if k[0] == symbol]
+                    keys_for_symbol = positions.keys_for(symbol)
                     for key in keys_for_symbol:
                         self._check_and_apply_roll(
                             position=positions[key],
@@ -333,7 +369,7 @@ class StrategyEngine:
             # 1) Existing positions: open-gap stop, pending open exits, intraday stop.
             for _, row in day_df.iterrows():
                 symbol = str(row[cfg.symbol_col])
-                keys_for_symbol = [k for k in positions if k[0] == symbol]
+                keys_for_symbol = positions.keys_for(symbol)
                 for key in keys_for_symbol:
                     position = positions[key]
                     exit_record = self._process_open_and_intraday_for_existing_position(
@@ -348,7 +384,7 @@ class StrategyEngine:
             # 2) Pending entries fill at today's open.
             for _, row in day_df.iterrows():
                 symbol = str(row[cfg.symbol_col])
-                keys_for_symbol = [k for k in pending_entries if k[0] == symbol]
+                keys_for_symbol = pending_entries.keys_for(symbol)
                 for key in keys_for_symbol:
                     pending = pending_entries[key]
                     if pending.entry_date != date:
@@ -462,20 +498,20 @@ class StrategyEngine:
             # 3) Close-phase logic for surviving positions.
             for _, row in day_df.iterrows():
                 symbol = str(row[cfg.symbol_col])
-                keys_for_symbol = [k for k in positions if k[0] == symbol]
+                keys_for_symbol = positions.keys_for(symbol)
+                if not keys_for_symbol:
+                    continue
+                next_trade_date = row["next_trade_date"]
                 for key in keys_for_symbol:
                     position = positions[key]
-                    slot = self._strategy_map[position.strategy_id]
-                    slot.exit_strategy.process_close_phase(
-                        position=position, row=row, next_trade_date=row["next_trade_date"],
+                    close_phase_by_strategy[position.strategy_id](
+                        position=position, row=row, next_trade_date=next_trade_date,
                     )
 
             # 4) Update last available mark per symbol (settle when present, else close).
-            for _, row in day_df.iterrows():
-                sym = str(row[cfg.symbol_col])
-                last_close_by_symbol[sym] = float(row[mark_col_effective])
-                if cfg.enable_dual_stream:
-                    last_raw_close_by_symbol[sym] = float(row[mark_raw_col_effective])
+            last_close_by_symbol.update(close_map)
+            if cfg.enable_dual_stream:
+                last_raw_close_by_symbol.update(raw_close_map)
 
             # 5) Mark portfolio at today's close.
             equity_close = self._compute_equity_close(
@@ -510,15 +546,16 @@ class StrategyEngine:
             # when the cap is enabled — cheap path stays cheap.
             if cfg.max_margin_utilization > 0.0:
                 base_occupied_margin = 0.0
+                # Today's per-row margin_rate (if bars carry it), looked up by
+                # symbol instead of boolean-filtering day_df per position.
+                margin_rate_by_symbol: Dict[str, float] = (
+                    dict(zip(day_df[cfg.symbol_col], day_df[cfg.margin_rate_col].astype(float)))
+                    if positions and cfg.margin_rate_col in day_df.columns
+                    else {}
+                )
                 for pos in positions.values():
                     mark = close_map.get(pos.symbol, last_close_by_symbol.get(pos.symbol, pos.entry_fill))
-                    base_rate = cfg.default_margin_rate
-                    # Try to pick up today's margin_rate if bars carry it per-row.
-                    day_df = rows_by_date.get(date)
-                    if day_df is not None:
-                        sym_row = day_df[day_df[cfg.symbol_col] == pos.symbol]
-                        if not sym_row.empty and cfg.margin_rate_col in sym_row.columns:
-                            base_rate = float(sym_row.iloc[0][cfg.margin_rate_col])
+                    base_rate = margin_rate_by_symbol.get(pos.symbol, cfg.default_margin_rate)
                     eff_rate = self._effective_margin_rate(base_rate, pos.current_contract, date)
                     base_occupied_margin += pos.qty * mark * pos.contract_multiplier * eff_rate
             else:
@@ -686,19 +723,16 @@ class StrategyEngine:
             total_notional = base_notional + accepted_notional_today
             leverage = total_notional / equity_close if equity_close > cfg.eps else 0.0
 
-            portfolio_daily.append(
-                {
-                    "date": date,
-                    "cash": cash,
-                    "equity": equity_close,
-                    "open_positions": len(positions),
-                    "pending_entries": len(pending_entries),
-                    "open_risk": open_risk_total,
-                    "portfolio_risk_cap": equity_close * cfg.portfolio_risk_cap,
-                    "accepted_signal_risk_today": accepted_today_risk_total,
-                    "total_notional": total_notional,
-                    "leverage": leverage,
-                }
+            portfolio_daily[day_idx] = (
+                cash,
+                equity_close,
+                len(positions),
+                len(pending_entries),
+                open_risk_total,
+                equity_close * cfg.portfolio_risk_cap,
+                accepted_today_risk_total,
+                total_notional,
+                leverage,
             )
 
         trades_df = self._empty_trades_frame()
@@ -709,16 +743,14 @@ class StrategyEngine:
 
         # Daily status uses the first strategy's prepared data (backward compat)
         daily_status = prepared.copy()
-        risk_reject_df = pd.DataFrame(
+        # Plain tuples + explicit columns: no per-row dict for pandas to re-key.
+        risk_reject_df = pd.DataFrame.from_records(
             [
-                {
-                    cfg.date_col: key[0],
-                    cfg.symbol_col: key[1],
-                    "risk_reject_reason": value,
-                }
-                for key, value in risk_reject.items()
-                if key[2] == first_strategy_id  # only first strategy for daily_status
-            ]
+                (date, symbol, value)
+                for (date, symbol, strategy_id), value in risk_reject.items()
+                if strategy_id == first_strategy_id  # only first strategy for daily_status
+            ],
+            columns=[cfg.date_col, cfg.symbol_col, "risk_reject_reason"],
         )
         if risk_reject_df.empty:
             daily_status["risk_reject_reason"] = None
@@ -734,7 +766,9 @@ class StrategyEngine:
         ).reset_index(drop=True)
 
         open_positions_df = self._serialize_open_positions(positions)
-        portfolio_daily_df = pd.DataFrame(portfolio_daily).sort_values("date").reset_index(drop=True)
+        # `dates` is already sorted, so records are in date order.
+        portfolio_daily_df = pd.DataFrame(portfolio_daily)
+        portfolio_daily_df.insert(0, "date", dates)
         cancelled_entries_df = self._empty_cancelled_entries_frame()
         if cancelled_entries:
             cancelled_entries_df = pd.DataFrame(cancelled_entries).sort_values(
@@ -823,9 +857,12 @@ class StrategyEngine:
 
         if (high < low).any():
             raise ValueError("Invalid OHLC: high < low.")
-        if (high < pd.concat([open_, close], axis=1).max(axis=1)).any():
+        # fmax/fmin skip NaN like DataFrame.max/min(axis=1), minus the concat.
+        open_arr = open_.to_numpy()
+        close_arr = close.to_numpy()
+        if (high.to_numpy() < np.fmax(open_arr, close_arr)).any():
             raise ValueError("Invalid OHLC: high < max(open, close).")
-        if (low > pd.concat([open_, close], axis=1).min(axis=1)).any():
+        if (low.to_numpy() > np.fmin(open_arr, close_arr)).any():
             raise ValueError("Invalid OHLC: low > min(open, close).")
         if (multiplier <= 0).any():
             raise ValueError("contract_multiplier must be > 0.")
@@ -851,7 +888,7 @@ class StrategyEngine:
         out["adx"] = _adx(high=high, low=low, close=close, period=cfg.adx_period)
         out["next_trade_date"] = out[cfg.date_col].shift(-1)
         # Per-symbol bar index (0-based), used by the warmup gate (1.7).
-        out["_bar_index"] = np.arange(len(out), dtype=int)
+        out["_bar_index"] = np.arange(len(out), dtype=np.int32)  # per-symbol bar count fits int32
         return out
 
     def _prepare_symbol_frame(self, df: pd.DataFrame) -> pd.DataFrame:
@@ -859,22 +896,48 @@ class StrategyEngine:
         base = self._prepare_symbol_base(df)
         return self._strategies[0].entry_strategy.prepare_signals(base)
 
-    def _prepare_all_strategies(self, bars: pd.DataFrame) -> Dict[str, pd.DataFrame]:
+    def prepare_base(self, bars: pd.DataFrame) -> List[pd.DataFrame]:
+        """Validated per-symbol base frames (ATR, atr_ref, ADX, next_trade_date).
+
+        Depends only on the bars and the engine config, never on a strategy, so
+        parameter sweeps compute it once and pass it to ``prepare_strategies``.
+        """
+        cfg = self.config
+        df = self._normalize_and_validate_bars(bars)
+        return [
+            self._prepare_symbol_base(symbol_df.reset_index(drop=True))
+            for _, symbol_df in df.groupby(cfg.symbol_col, sort=False)
+        ]
+
+    def prepare_strategies(
+        self,
+        bars: pd.DataFrame,
+        base_frames: Optional[List[pd.DataFrame]] = None,
+    ) -> Dict[str, pd.DataFrame]:
+        """Prepared frames per strategy_id, reusable via ``run(prepared_by_strategy=...)``.
+
+        `base_frames` optionally supplies ``prepare_base(bars)`` computed earlier
+        (same bars, same engine config).
+        """
+        return self._prepare_all_strategies(bars, base_frames=base_frames)
+
+    def _prepare_all_strategies(
+        self,
+        bars: pd.DataFrame,
+        base_frames: Optional[List[pd.DataFrame]] = None,
+    ) -> Dict[str, pd.DataFrame]:
         """Prepare data for every strategy slot.
 
         Returns a dict keyed by strategy_id. Each value is a fully-prepared
         DataFrame (base columns + that strategy's signal columns).
         """
         cfg = self.config
-        df = self._normalize_and_validate_bars(bars)
-
-        # Build base frames per symbol (ATR, atr_ref, next_trade_date)
-        base_frames: List[pd.DataFrame] = []
-        for _, symbol_df in df.groupby(cfg.symbol_col, sort=False):
-            base_frames.append(self._prepare_symbol_base(symbol_df.reset_index(drop=True)))
+        if base_frames is None:
+            base_frames = self.prepare_base(bars)
 
         if not base_frames:
             # Empty input
+            df = self._normalize_and_validate_bars(bars)
             result: Dict[str, pd.DataFrame] = {}
             for slot in self._strategies:
                 empty = df.copy()
@@ -883,24 +946,46 @@ class StrategyEngine:
                 result[slot.strategy_id] = empty
             return result
 
-        base_all = pd.concat(base_frames, axis=0, ignore_index=True)
-        base_all = base_all.sort_values([cfg.date_col, cfg.symbol_col]).reset_index(drop=True)
-
         # For each strategy slot, apply its entry_strategy.prepare_signals
-        # on per-symbol copies of the base frame
+        # directly on the per-symbol base frames. They are already split by
+        # symbol and date-ordered, so there is no need to concat them into one
+        # frame and regroup; only each slot's final output is concatenated.
+        # Entry strategies copy their input, so the base frames are shared.
         result = {}
         for slot in self._strategies:
-            slot_frames: List[pd.DataFrame] = []
-            for _, symbol_df in base_all.groupby(cfg.symbol_col, sort=False):
-                slot_frames.append(
-                    slot.entry_strategy.prepare_signals(symbol_df.reset_index(drop=True))
-                )
+            slot_frames = [slot.entry_strategy.prepare_signals(base) for base in base_frames]
             slot_prepared = pd.concat(slot_frames, axis=0, ignore_index=True)
             slot_prepared = slot_prepared.sort_values([cfg.date_col, cfg.symbol_col]).reset_index(drop=True)
             result[slot.strategy_id] = slot_prepared
 
         return result
 
+    def _split_by_date(self, frame: pd.DataFrame) -> Dict[pd.Timestamp, pd.DataFrame]:
+        """Split a prepared frame into {date: that day's rows in symbol order}.
+
+        Prepared frames come out of ``prepare_strategies`` already sorted by
+        (date, symbol), so the groupby keeps each day in symbol order without
+        a sort per day; frames supplied in another order are sorted once.
+        """
+        cfg = self.config
+        order = pd.MultiIndex.from_arrays([frame[cfg.date_col], frame[cfg.symbol_col]])
+        if not order.is_monotonic_increasing:
+            frame = frame.sort_values([cfg.date_col, cfg.symbol_col], kind="stable")
+        return {
+            date: day_df.reset_index(drop=True)
+            for date, day_df in frame.groupby(cfg.date_col, sort=True)
+        }
+
+    @staticmethod
+    def _metadata_for_record(metadata: Dict[str, Any]) -> Dict[str, Any]:
+        """Position metadata for output frames, minus the exits' rolling windows.
+
+        The deques (`_boll_closes`, `_hl_highs`, ...) are per-bar working state
+        bounded to the exit's lookback, not trade attributes, so they are left
+        out of trade and open-position records.
+        """
+        return {k: v for k, v in metadata.items() if not isinstance(v, deque)}
+
     @staticmethod
     def _months_to_delivery(order_book_id: Optional[str], today: pd.Timestamp) -> Optional[int]:
         """Months between `today` and the delivery month encoded in the last
@@ -1047,8 +1132,8 @@ class StrategyEngine:
             segment_entry_fill=segment_entry_init,
             active_stop_series=[
                 {
-                    "computed_on": pending.signal_date.strftime("%Y-%m-%d"),
-                    "effective_from": pending.entry_date.strftime("%Y-%m-%d"),
+                    "computed_on": format_date(pending.signal_date),
+                    "effective_from": format_date(pending.entry_date),
                     "phase": "signal_init",
                     "active_stop_before": None,
                     "active_stop_after": pending.initial_stop,
@@ -1374,7 +1459,7 @@ class StrategyEngine:
             "rolls_detail": json.dumps(position.rolls_crossed, ensure_ascii=False),
             "cash_delta": cash_delta,
         }
-        record.update(position.metadata)
+        record.update(self._metadata_for_record(position.metadata))
         return record
 
     def _compute_equity_close(
@@ -1505,7 +1590,7 @@ class StrategyEngine:
                 "entry_slippage": position.entry_slippage,
                 "entry_commission_per_contract": position.entry_commission_per_contract,
             }
-            row_dict.update(position.metadata)
+            row_dict.update(self._metadata_for_record(position.metadata))
             rows.append(row_dict)
         if not rows:
             return self._empty_open_positions_frame()
@@ -1514,6 +1599,18 @@ class StrategyEngine:
     # Engine-universal columns always present in prepared data
     _ENGINE_BASE_COLUMNS = ["atr", "atr_ref", "next_trade_date"]
     _ENGINE_SIGNAL_COLUMNS = ["entry_trigger_pass", "entry_direction"]
+    # portfolio_daily is one snapshot per date (date column added separately).
+    _PORTFOLIO_DAILY_DTYPE = np.dtype([
+        ("cash", "f8"),
+        ("equity", "f8"),
+        ("open_positions", "i8"),
+        ("pending_entries", "i8"),
+        ("open_risk", "f8"),
+        ("portfolio_risk_cap", "f8"),
+        ("accepted_signal_risk_today", "f8"),
+        ("total_notional", "f8"),
+        ("leverage", "f8"),
+    ])
 
     def _prepared_extra_columns(self) -> List[str]:
         """Minimum extra columns guaranteed by the engine (for empty frame)."""
@@ -14,6 +14,8 @@ from typing import Any, Dict, Optional
 import numpy as np
 import pandas as pd
 
+from strats.helpers import adaptive_ma
+
 @dataclass(frozen=True)
 class AmaEntryConfig:
     n: int = 10
@@ -49,25 +51,8 @@ class AmaEntryStrategy:
         slow_sc = 2.0 / (cfg.slow_period + 1)
         sc = (er * (fast_sc - slow_sc) + slow_sc) ** 2
 
-        # AMA recursive computation (must be a loop)
-        sc_arr = sc.to_numpy(dtype=float)
-        cs_arr = close_shifted.to_numpy(dtype=float)
-        ama_arr = np.full(len(close), np.nan, dtype=float)
-
-        # Find first valid index where both sc and close_shifted are available
-        first = None
-        for i in range(len(close)):
-            if not np.isnan(sc_arr[i]) and not np.isnan(cs_arr[i]):
-                first = i
-                break
-
-        if first is not None:
-            ama_arr[first] = cs_arr[first]
-            for i in range(first + 1, len(close)):
-                if np.isnan(sc_arr[i]):
-                    ama_arr[i] = ama_arr[i - 1]
-                    continue
-                ama_arr[i] = ama_arr[i - 1] + sc_arr[i] * (cs_arr[i] - ama_arr[i - 1])
+        # AMA recursive computation (sequential; numba kernel when installed)
+        ama_arr = adaptive_ma(sc.to_numpy(dtype=float), close_shifted.to_numpy(dtype=float))
 
         ama = pd.Series(ama_arr, index=df.index)
         ama_prev = ama.shift(1)
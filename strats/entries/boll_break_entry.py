@@ -14,6 +14,8 @@ from typing import Any, Dict, Optional
 import numpy as np
 import pandas as pd
 
+from strats.helpers import rolling_mean, rolling_std
+
 @dataclass(frozen=True)
 class BollBreakEntryConfig:
     period: int = 22
@@ -37,8 +39,8 @@ class BollBreakEntryStrategy:
 
         # Bollinger Bands on completed bars
         close_shifted = close.shift(1)
-        ma = close_shifted.rolling(cfg.period, min_periods=cfg.period).mean()
-        std = close_shifted.rolling(cfg.period, min_periods=cfg.period).std(ddof=0)
+        ma = rolling_mean(close_shifted, cfg.period)
+        std = rolling_std(close_shifted, cfg.period, ddof=0)
         upper = ma + cfg.k * std
         lower = ma - cfg.k * std
 
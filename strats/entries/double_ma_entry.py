@@ -14,6 +14,8 @@ from typing import Any, Dict, Optional
 import numpy as np
 import pandas as pd
 
+from strats.helpers import rolling_mean
+
 @dataclass(frozen=True)
 class DoubleMaEntryConfig:
     fast: int = 13
@@ -36,22 +38,29 @@ class DoubleMaEntryStrategy:
         close = df["close"].astype(float)
 
         close_shifted = close.shift(1)
-        ma_fast = close_shifted.rolling(cfg.fast, min_periods=cfg.fast).mean()
-        ma_slow = close_shifted.rolling(cfg.slow, min_periods=cfg.slow).mean()
-        ma_fast_prev = ma_fast.shift(1)
-        ma_slow_prev = ma_slow.shift(1)
-
+        ma_fast = rolling_mean(close_shifted, cfg.fast)
+        ma_slow = rolling_mean(close_shifted, cfg.slow)
+
+        # Crossovers on raw arrays: compare bar i against bar i-1 via offset
+        # slices instead of two more shifted Series. NaN compares False, so
+        # warmup bars never trigger (same as the old fillna(False)).
+        fast_arr = ma_fast.to_numpy()
+        slow_arr = ma_slow.to_numpy()
+        n = len(fast_arr)
         # Golden cross: fast crosses above slow
-        long_trigger = (ma_fast > ma_slow) & (ma_fast_prev <= ma_slow_prev)
+        long_trigger = np.zeros(n, dtype=bool)
+        long_trigger[1:] = (fast_arr[1:] > slow_arr[1:]) & (fast_arr[:-1] <= slow_arr[:-1])
         # Death cross: fast crosses below slow
-        short_trigger = pd.Series(False, index=df.index)
+        short_trigger = np.zeros(n, dtype=bool)
         if cfg.allow_short:
-            short_trigger = (ma_fast < ma_slow) & (ma_fast_prev >= ma_slow_prev)
-
-        entry_trigger_pass = (long_trigger | short_trigger).fillna(False)
-        entry_direction = pd.Series(0, index=df.index, dtype=int)
-        entry_direction[long_trigger.fillna(False)] = 1
-        entry_direction[short_trigger.fillna(False) & ~long_trigger.fillna(False)] = -1
+            short_trigger[1:] = (fast_arr[1:] < slow_arr[1:]) & (fast_arr[:-1] >= slow_arr[:-1])
+
+        entry_trigger_pass = pd.Series(long_trigger | short_trigger, index=df.index)
+        entry_direction = pd.Series(
+            np.where(long_trigger, 1, np.where(short_trigger, -1, 0)),
+            index=df.index,
+            dtype=int,
+        )
 
         # Initial stop: slow MA as support/resistance
 
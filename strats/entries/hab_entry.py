@@ -12,6 +12,8 @@ from strats.helpers import (
     detect_hlh_pattern,
     detect_lhl_pattern,
     rolling_last_value_percentile,
+    rolling_mean,
+    rolling_std,
 )
 
 @dataclass(frozen=True)
@@ -49,8 +51,8 @@ class HABEntryStrategy:
         atr_ref = df["atr_ref"]
 
         # BB bands
-        bb_mid = close.rolling(cfg.bb_period, min_periods=cfg.bb_period).mean()
-        bb_std_val = close.rolling(cfg.bb_period, min_periods=cfg.bb_period).std(ddof=0)
+        bb_mid = rolling_mean(close, cfg.bb_period)
+        bb_std_val = rolling_std(close, cfg.bb_period, ddof=0)
         bb_upper = bb_mid + cfg.bb_std * bb_std_val
         bb_lower = bb_mid - cfg.bb_std * bb_std_val
 
@@ -77,17 +79,22 @@ class HABEntryStrategy:
         has_lower_test_2 = np.zeros(len(df), dtype=bool)
         l_h_l_valid = np.zeros(len(df), dtype=bool)
 
-        for i in range(len(df)):
-            if i < cfg.box_lookback:
-                continue
-            if pd.isna(box_high.iloc[i]) or pd.isna(box_low.iloc[i]) or pd.isna(tol.iloc[i]):
-                continue
-
-            win_h = high.iloc[i - cfg.box_lookback : i].tolist()
-            win_l = low.iloc[i - cfg.box_lookback : i].tolist()
-            bh = float(box_high.iloc[i])
-            bl = float(box_low.iloc[i])
-            t = float(tol.iloc[i])
+        # Scan on raw arrays: per-bar .iloc builds a Series on every access.
+        # Only bars with a complete box and tolerance can hold a pattern.
+        high_arr = high.to_numpy()
+        low_arr = low.to_numpy()
+        box_high_arr = box_high.to_numpy()
+        box_low_arr = box_low.to_numpy()
+        tol_arr = tol.to_numpy(dtype=float)
+        candidates = np.flatnonzero(
+            ~np.isnan(box_high_arr) & ~np.isnan(box_low_arr) & ~np.isnan(tol_arr)
+        )
+        for i in candidates[candidates >= cfg.box_lookback].tolist():
+            win_h = high_arr[i - cfg.box_lookback : i].tolist()
+            win_l = low_arr[i - cfg.box_lookback : i].tolist()
+            bh = float(box_high_arr[i])
+            bl = float(box_low_arr[i])
+            t = float(tol_arr[i])
 
             valid, flag_u1, flag_l1, flag_u2 = detect_hlh_pattern(
                 high_window=win_h, low_window=win_l, box_high=bh, box_low=bl, tol=t,
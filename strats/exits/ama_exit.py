@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass
 from typing import Any, Optional
 
 import numpy as np
 import pandas as pd
 
-from strats.helpers import favorable_excursion, adverse_excursion
+from strats.helpers import favorable_excursion, adverse_excursion, format_date
 
 
 @dataclass(frozen=True)
@@ -43,7 +44,10 @@ class AmaExitStrategy:
         position.mae_price = max(position.mae_price, adverse_excursion(adv, position.entry_fill, d))
 
         # Incremental AMA computation
-        closes = position.metadata.setdefault("_ama_closes", [])
+        # Only the last n+1 closes are needed (n-bar direction + n diffs).
+        closes = position.metadata.get("_ama_closes")
+        if closes is None:
+            closes = position.metadata["_ama_closes"] = deque(maxlen=cfg.n + 1)
         closes.append(close_price)
         prev_ama = position.metadata.get("_ama_value")
 
@@ -85,8 +89,8 @@ class AmaExitStrategy:
                 position.active_stop = min(position.active_stop, ama_value)
 
         position.active_stop_series.append({
-            "computed_on": date.strftime("%Y-%m-%d"),
-            "effective_from": pd.Timestamp(next_trade_date).strftime("%Y-%m-%d") if pd.notna(next_trade_date) else None,
+            "computed_on": format_date(date),
+            "effective_from": format_date(next_trade_date),
             "phase": "close_update",
             "active_stop_before": active_stop_before,
             "active_stop_after": position.active_stop,
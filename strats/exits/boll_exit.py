@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass
 from typing import Any, Optional
 
 import numpy as np
 import pandas as pd
 
-from strats.helpers import favorable_excursion, adverse_excursion
+from strats.helpers import favorable_excursion, adverse_excursion, format_date
 
 
 @dataclass(frozen=True)
@@ -40,14 +41,16 @@ class BollExitStrategy:
         position.mfe_price = max(position.mfe_price, favorable_excursion(fav, position.entry_fill, d))
         position.mae_price = max(position.mae_price, adverse_excursion(adv, position.entry_fill, d))
 
-        closes = position.metadata.setdefault("_boll_closes", [])
+        closes = position.metadata.get("_boll_closes")
+        if closes is None:
+            closes = position.metadata["_boll_closes"] = deque(maxlen=cfg.period)
         closes.append(close_price)
 
         trailing_stop_candidate: Optional[float] = None
         active_stop_before = position.active_stop
 
         if len(closes) >= cfg.period and position.pending_exit_reason is None and pd.notna(next_trade_date):
-            window = closes[-cfg.period:]
+            window = np.fromiter(closes, dtype=float, count=len(closes))
             ma = np.mean(window)
             std = np.std(window, ddof=0)
             upper = ma + cfg.k * std
@@ -67,8 +70,8 @@ class BollExitStrategy:
                 position.active_stop = min(position.active_stop, upper)
 
         position.active_stop_series.append({
-            "computed_on": date.strftime("%Y-%m-%d"),
-            "effective_from": pd.Timestamp(next_trade_date).strftime("%Y-%m-%d") if pd.notna(next_trade_date) else None,
+            "computed_on": format_date(date),
+            "effective_from": format_date(next_trade_date),
             "phase": "close_update",
             "active_stop_before": active_stop_before,
             "active_stop_after": position.active_stop,
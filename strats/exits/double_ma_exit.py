@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass
 from typing import Any, Optional
 
 import numpy as np
 import pandas as pd
 
-from strats.helpers import favorable_excursion, adverse_excursion
+from strats.helpers import favorable_excursion, adverse_excursion, format_date
 
 
 @dataclass(frozen=True)
@@ -40,14 +41,17 @@ class DoubleMaExitStrategy:
         position.mfe_price = max(position.mfe_price, favorable_excursion(fav, position.entry_fill, d))
         position.mae_price = max(position.mae_price, adverse_excursion(adv, position.entry_fill, d))
 
-        closes = position.metadata.setdefault("_dma_closes", [])
+        closes = position.metadata.get("_dma_closes")
+        if closes is None:
+            closes = position.metadata["_dma_closes"] = deque(maxlen=cfg.slow)
         closes.append(close_price)
 
         active_stop_before = position.active_stop
 
         if len(closes) >= cfg.slow and position.pending_exit_reason is None and pd.notna(next_trade_date):
-            ma_fast = np.mean(closes[-cfg.fast:])
-            ma_slow = np.mean(closes[-cfg.slow:])
+            window = np.fromiter(closes, dtype=float, count=len(closes))
+            ma_fast = np.mean(window[-cfg.fast:])
+            ma_slow = np.mean(window)
 
             if d == 1 and ma_fast < ma_slow:
                 position.pending_exit_reason = "DMA_EXIT"
@@ -57,8 +61,8 @@ class DoubleMaExitStrategy:
                 position.pending_exit_date = pd.Timestamp(next_trade_date)
 
         position.active_stop_series.append({
-            "computed_on": date.strftime("%Y-%m-%d"),
-            "effective_from": pd.Timestamp(next_trade_date).strftime("%Y-%m-%d") if pd.notna(next_trade_date) else None,
+            "computed_on": format_date(date),
+            "effective_from": format_date(next_trade_date),
             "phase": "close_update",
             "active_stop_before": active_stop_before,
             "active_stop_after": position.active_stop,
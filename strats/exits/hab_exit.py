@@ -8,7 +8,7 @@ from typing import Any, Literal, Optional
 import numpy as np
 import pandas as pd
 
-from strats.helpers import favorable_excursion, adverse_excursion
+from strats.helpers import favorable_excursion, adverse_excursion, format_date
 
 
 @dataclass(frozen=True)
@@ -110,12 +110,8 @@ class HABExitStrategy:
 
         position.active_stop_series.append(
             {
-                "computed_on": date.strftime("%Y-%m-%d"),
-                "effective_from": (
-                    pd.Timestamp(next_trade_date).strftime("%Y-%m-%d")
-                    if pd.notna(next_trade_date)
-                    else None
-                ),
+                "computed_on": format_date(date),
+                "effective_from": format_date(next_trade_date),
                 "phase": "close_update",
                 "active_stop_before": active_stop_before,
                 "active_stop_after": position.active_stop,
@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass
 from typing import Any, Optional
 
 import numpy as np
 import pandas as pd
 
-from strats.helpers import favorable_excursion, adverse_excursion
+from strats.helpers import favorable_excursion, adverse_excursion, format_date
 
 
 @dataclass(frozen=True)
@@ -39,14 +40,14 @@ class HLExitStrategy:
         position.mfe_price = max(position.mfe_price, favorable_excursion(fav, position.entry_fill, d))
         position.mae_price = max(position.mae_price, adverse_excursion(adv, position.entry_fill, d))
 
-        # Track rolling window in metadata
-        highs = position.metadata.setdefault("_hl_highs", [])
-        lows = position.metadata.setdefault("_hl_lows", [])
+        # Track rolling window in metadata (bounded deques drop the oldest bar)
+        highs = position.metadata.get("_hl_highs")
+        if highs is None:
+            highs = position.metadata["_hl_highs"] = deque(maxlen=cfg.period)
+            position.metadata["_hl_lows"] = deque(maxlen=cfg.period)
+        lows = position.metadata["_hl_lows"]
         highs.append(high_price)
         lows.append(low_price)
-        if len(highs) > cfg.period:
-            highs[:] = highs[-cfg.period:]
-            lows[:] = lows[-cfg.period:]
 
         trailing_stop_candidate: Optional[float] = None
         active_stop_before = position.active_stop
@@ -68,8 +69,8 @@ class HLExitStrategy:
                 position.active_stop = min(position.active_stop, trailing_high)
 
         position.active_stop_series.append({
-            "computed_on": date.strftime("%Y-%m-%d"),
-            "effective_from": pd.Timestamp(next_trade_date).strftime("%Y-%m-%d") if pd.notna(next_trade_date) else None,
+            "computed_on": format_date(date),
+            "effective_from": format_date(next_trade_date),
             "phase": "close_update",
             "active_stop_before": active_stop_before,
             "active_stop_after": position.active_stop,
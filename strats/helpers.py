@@ -6,11 +6,27 @@ portfolio analytics. All functions are stateless module-level utilities.
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Tuple
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
 
+try:
+    from numba import njit as _njit
+except ImportError:  # pragma: no cover - numba is optional
+    _njit = None
+
+try:
+    import bottleneck as _bn
+except ImportError:  # pragma: no cover - bottleneck is optional
+    _bn = None
+
+
+def _maybe_jit(func):
+    """Compile a scalar-loop kernel with numba when installed, else leave it as Python."""
+    return _njit(cache=True, nogil=True)(func) if _njit is not None else func
+
 
 # ── Direction-aware helpers ────────────────────────────────────────────────
 
@@ -36,16 +52,36 @@ def adverse_excursion(extreme_price: float, entry_price: float, direction: int)
     return max(extreme_price - entry_price, 0.0)
 
 
+@lru_cache(maxsize=16384)
+def _format_timestamp(ts: pd.Timestamp) -> str:
+    return ts.strftime("%Y-%m-%d")
+
+
+def format_date(value: Any) -> Optional[str]:
+    """`YYYY-MM-DD` for a date-like value, None for NaT/None.
+
+    Exits log a stop record per open position per bar, so the same few
+    thousand trading days get formatted over and over; the string is
+    memoized per Timestamp.
+    """
+    if value is None or pd.isna(value):
+        return None
+    if type(value) is not pd.Timestamp:
+        value = pd.Timestamp(value)
+    return _format_timestamp(value)
+
+
 # ── Technical indicators ──────────────────────────────────────────────────
 
 
-def wilder_smooth(values: np.ndarray, period: int) -> np.ndarray:
-    """Wilder's recursive smoothing (used by ATR and ADX). NaN-safe."""
-    out = np.full(len(values), np.nan, dtype=float)
-    if len(values) < period:
+@_maybe_jit
+def _wilder_smooth_kernel(values: np.ndarray, period: int) -> np.ndarray:
+    n = len(values)
+    out = np.full(n, np.nan)
+    if n < period:
         return out
     out[period - 1] = np.nanmean(values[:period])
-    for i in range(period, len(values)):
+    for i in range(period, n):
         prev = out[i - 1]
         cur = values[i]
         if np.isnan(cur):
@@ -57,6 +93,48 @@ def wilder_smooth(values: np.ndarray, period: int) -> np.ndarray:
     return out
 
 
+def wilder_smooth(values: np.ndarray, period: int) -> np.ndarray:
+    """Wilder's recursive smoothing (used by ATR and ADX). NaN-safe.
+
+    The recursion is inherently sequential; the loop lives in a kernel that
+    numba compiles when available (ATR + ADX call it four times per symbol).
+    """
+    return _wilder_smooth_kernel(np.ascontiguousarray(values, dtype=np.float64), int(period))
+
+
+@_maybe_jit
+def _adaptive_ma_kernel(sc: np.ndarray, values: np.ndarray) -> np.ndarray:
+    n = len(values)
+    out = np.full(n, np.nan)
+    first = -1
+    for i in range(n):
+        if not np.isnan(sc[i]) and not np.isnan(values[i]):
+            first = i
+            break
+    if first < 0:
+        return out
+    out[first] = values[first]
+    for i in range(first + 1, n):
+        if np.isnan(sc[i]):
+            out[i] = out[i - 1]
+        else:
+            out[i] = out[i - 1] + sc[i] * (values[i] - out[i - 1])
+    return out
+
+
+def adaptive_ma(sc: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """Kaufman AMA recursion: ``ama[i] = ama[i-1] + sc[i] * (values[i] - ama[i-1])``.
+
+    Seeds at the first bar where both inputs are valid; a NaN smoothing
+    constant carries the previous value forward. Sequential, so it runs in a
+    numba kernel when available.
+    """
+    return _adaptive_ma_kernel(
+        np.ascontiguousarray(sc, dtype=np.float64),
+        np.ascontiguousarray(values, dtype=np.float64),
+    )
+
+
 def adx(high: pd.Series, low: pd.Series, close: pd.Series, period: int = 20) -> pd.Series:
     """Average Directional Index (ADX). Returns values 0-100."""
     h = high.to_numpy(dtype=float)
@@ -93,12 +171,38 @@ def adx(high: pd.Series, low: pd.Series, close: pd.Series, period: int = 20) ->
 
 
 def wilder_atr(high: pd.Series, low: pd.Series, close: pd.Series, period: int) -> pd.Series:
-    prev_close = close.shift(1)
-    tr = pd.concat(
-        [(high - low).abs(), (high - prev_close).abs(), (low - prev_close).abs()],
-        axis=1,
-    ).max(axis=1)
-    return pd.Series(wilder_smooth(tr.to_numpy(dtype=float), period), index=tr.index)
+    """Wilder ATR. True range is built on raw arrays, no 3-column frame.
+
+    ``np.fmax`` skips NaN like ``DataFrame.max(axis=1)``, so the first bar
+    (no previous close) still gets TR = high - low.
+    """
+    hi = high.to_numpy(dtype=float)
+    lo = low.to_numpy(dtype=float)
+    c = close.to_numpy(dtype=float)
+    prev_c = np.full(len(c), np.nan)
+    prev_c[1:] = c[:-1]
+    tr = np.fmax(np.fmax(np.abs(hi - lo), np.abs(hi - prev_c)), np.abs(lo - prev_c))
+    return pd.Series(wilder_smooth(tr, period), index=high.index)
+
+
+def rolling_mean(values: pd.Series, window: int) -> pd.Series:
+    """Full-window rolling mean: NaN until `window` consecutive valid values.
+
+    Same result as ``values.rolling(window, min_periods=window).mean()``;
+    uses bottleneck's C moving-window kernel when it is installed.
+    """
+    if _bn is None:
+        return values.rolling(window, min_periods=window).mean()
+    arr = values.to_numpy(dtype=float)
+    return pd.Series(_bn.move_mean(arr, window, min_count=window), index=values.index)
+
+
+def rolling_std(values: pd.Series, window: int, ddof: int = 0) -> pd.Series:
+    """Full-window rolling standard deviation; see ``rolling_mean``."""
+    if _bn is None:
+        return values.rolling(window, min_periods=window).std(ddof=ddof)
+    arr = values.to_numpy(dtype=float)
+    return pd.Series(_bn.move_std(arr, window, min_count=window, ddof=ddof), index=values.index)
 
 
 def rolling_last_value_percentile(values: pd.Series, window: int) -> pd.Series:
@@ -109,14 +213,17 @@ def rolling_last_value_percentile(values: pd.Series, window: int) -> pd.Series:
     """
     arr = values.to_numpy(dtype=float)
     out = np.full(len(arr), np.nan, dtype=float)
-    for i in range(window - 1, len(arr)):
-        sample = arr[i - window + 1 : i + 1]
-        if np.isnan(sample).any():
-            continue
-        last = sample[-1]
-        less = float(np.sum(sample < last))
-        equal = float(np.sum(sample == last))
-        out[i] = (less + 0.5 * equal) / float(window)
+    if window < 1 or len(arr) < window:
+        return pd.Series(out, index=values.index)
+    # One strided (n - window + 1, window) view instead of a per-bar loop;
+    # windows containing NaN stay NaN.
+    windows = np.lib.stride_tricks.sliding_window_view(arr, window)
+    last = windows[:, -1:]
+    less = (windows < last).sum(axis=1).astype(float)
+    equal = (windows == last).sum(axis=1).astype(float)
+    pct = (less + 0.5 * equal) / float(window)
+    pct[np.isnan(windows).any(axis=1)] = np.nan
+    out[window - 1:] = pct
     return pd.Series(out, index=values.index)
 
 
@@ -290,6 +397,27 @@ def pbo_cscv(returns_matrix: pd.DataFrame, n_splits: int = 16) -> float:
 # ── Portfolio analytics ───────────────────────────────────────────────────
 
 
+def win_rate_profit_factor(net_pnl: Any) -> Tuple[float, float]:
+    """Win rate and profit factor of a trade P&L column in one array pass.
+
+    Wins are ``pnl > 0``, losses ``pnl <= 0``. Profit factor is ``inf`` when
+    there are wins but no losing P&L, and 0.0 when there are no wins.
+    """
+    pnl = np.asarray(net_pnl, dtype=float)
+    if len(pnl) == 0:
+        return 0.0, 0.0
+    win_mask = pnl > 0
+    loss_mask = pnl <= 0
+    n_wins = int(win_mask.sum())
+    loss_sum = pnl[loss_mask].sum()
+    win_rate = n_wins / len(pnl)
+    if loss_mask.any() and loss_sum != 0:
+        profit_factor = pnl[win_mask].sum() / abs(loss_sum)
+    else:
+        profit_factor = float("inf") if n_wins > 0 else 0.0
+    return win_rate, profit_factor
+
+
 class PortfolioAnalyzer:
     """Post-hoc analysis of BacktestResult for portfolio-level metrics."""
 
@@ -309,41 +437,37 @@ class PortfolioAnalyzer:
         return out
 
     def drawdown_episodes(self) -> pd.DataFrame:
+        """Underwater episodes from the equity curve.
+
+        Works on the raw drawdown arrays: episodes are runs of ``drawdown < 0``
+        located with one ``np.diff`` pass, so pandas is only touched to read the
+        columns and to build the (short) result frame.
+        """
         ec = self.equity_curve()
         if ec.empty:
             return pd.DataFrame(columns=["start_date", "trough_date", "recovery_date", "max_drawdown_pct", "duration_days"])
+        dates = ec["date"]
+        drawdown_pct = ec["drawdown_pct"].to_numpy(dtype=float)
+        under = ec["drawdown"].to_numpy(dtype=float) < 0
+        edges = np.diff(np.concatenate(([0], under.astype(np.int8), [0])))
+        starts = np.flatnonzero(edges == 1)
+        ends = np.flatnonzero(edges == -1)  # first bar back at the peak, or len(ec)
+
         episodes: List[Dict[str, Any]] = []
-        in_dd = False
-        start = None
-        trough = None
-        trough_pct = 0.0
-        for _, row in ec.iterrows():
-            if row["drawdown"] < 0:
-                if not in_dd:
-                    in_dd = True
-                    start = row["date"]
-                    trough = row["date"]
-                    trough_pct = row["drawdown_pct"]
-                if row["drawdown_pct"] < trough_pct:
-                    trough = row["date"]
-                    trough_pct = row["drawdown_pct"]
-            else:
-                if in_dd:
-                    episodes.append({
-                        "start_date": start,
-                        "trough_date": trough,
-                        "recovery_date": row["date"],
-                        "max_drawdown_pct": trough_pct,
-                        "duration_days": (row["date"] - start).days,
-                    })
-                    in_dd = False
-        if in_dd:
+        for s, e in zip(starts, ends):
+            run_pct = drawdown_pct[s:e]
+            # Trough = first occurrence of the deepest drawdown_pct in the run
+            # (a NaN pct on the first bar pins the trough there, as before).
+            trough = s if np.isnan(run_pct[0]) else s + int(np.nanargmin(run_pct))
+            recovered = e < len(ec)
+            start_date = dates.iloc[s]
+            end_date = dates.iloc[e] if recovered else dates.iloc[-1]
             episodes.append({
-                "start_date": start,
-                "trough_date": trough,
-                "recovery_date": pd.NaT,
-                "max_drawdown_pct": trough_pct,
-                "duration_days": (ec["date"].iloc[-1] - start).days,
+                "start_date": start_date,
+                "trough_date": dates.iloc[trough],
+                "recovery_date": end_date if recovered else pd.NaT,
+                "max_drawdown_pct": drawdown_pct[trough],
+                "duration_days": (end_date - start_date).days,
             })
         return pd.DataFrame(episodes)
 
@@ -424,14 +548,9 @@ class PortfolioAnalyzer:
         }
 
         if not trades.empty:
-            wins = trades[trades["net_pnl"] > 0]
-            losses = trades[trades["net_pnl"] <= 0]
             stats["total_trades"] = len(trades)
-            stats["win_rate"] = len(wins) / len(trades) if len(trades) > 0 else 0.0
-            stats["profit_factor"] = (
-                wins["net_pnl"].sum() / abs(losses["net_pnl"].sum())
-                if len(losses) > 0 and losses["net_pnl"].sum() != 0
-                else float("inf") if len(wins) > 0 else 0.0
+            stats["win_rate"], stats["profit_factor"] = win_rate_profit_factor(
+                trades["net_pnl"].to_numpy()
             )
             stats["avg_r_multiple"] = trades["r_multiple"].mean()
             stats["expectancy"] = trades["net_pnl"].mean()
@@ -0,0 +1,61 @@
+"""Exit working state stays out of trade / open-position records."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from strats.engine import EngineConfig, StrategyEngine, StrategySlot
+from strats.entries.double_ma_entry import DoubleMaEntryConfig, DoubleMaEntryStrategy
+from strats.exits.ama_exit import AmaExitConfig, AmaExitStrategy
+from strats.exits.boll_exit import BollExitConfig, BollExitStrategy
+from strats.exits.double_ma_exit import DoubleMaExitConfig, DoubleMaExitStrategy
+from strats.exits.hl_exit import HLExitConfig, HLExitStrategy
+
+WINDOW_KEYS = {"_ama_closes", "_boll_closes", "_dma_closes", "_hl_highs", "_hl_lows"}
+
+
+def _bars(n: int = 160) -> pd.DataFrame:
+    rng = np.random.default_rng(3)
+    close = 3000.0 + np.cumsum(rng.normal(0.0, 30.0, size=n))
+    return pd.DataFrame({
+        "date": pd.bdate_range("2023-01-02", periods=n),
+        "symbol": "A",
+        "open": close, "high": close * 1.01, "low": close * 0.99, "close": close,
+        "volume": 1000.0, "open_interest": 5000.0,
+        "contract_multiplier": 10.0, "commission": 5.0, "slippage": 1.0,
+        "group_name": "G",
+    })
+
+
+def _cfg() -> EngineConfig:
+    return EngineConfig(
+        initial_capital=1_000_000.0,
+        atr_period=5, adx_period=5,
+        risk_per_trade=0.01, stop_atr_mult=2.0,
+        portfolio_risk_cap=1.0,
+        group_risk_cap={"G": 1.0}, default_group_risk_cap=1.0,
+        independent_group_soft_cap=1.0, risk_blowout_cap=float("inf"),
+        allow_short=True,
+    )
+
+
+@pytest.mark.parametrize(
+    "exit_strategy",
+    [
+        AmaExitStrategy(AmaExitConfig()),
+        BollExitStrategy(BollExitConfig()),
+        DoubleMaExitStrategy(DoubleMaExitConfig()),
+        HLExitStrategy(HLExitConfig()),
+    ],
+)
+def test_records_omit_exit_rolling_windows(exit_strategy) -> None:
+    entry = DoubleMaEntryStrategy(DoubleMaEntryConfig(fast=5, slow=20, allow_short=True))
+    engine = StrategyEngine(config=_cfg(), strategies=[StrategySlot("combo", entry, exit_strategy)])
+
+    result = engine.run(_bars())
+
+    assert len(result.trades) + len(result.open_positions) > 0
+    assert WINDOW_KEYS.isdisjoint(result.trades.columns)
+    assert WINDOW_KEYS.isdisjoint(result.open_positions.columns)
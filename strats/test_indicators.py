@@ -0,0 +1,124 @@
+"""Technical indicator helpers: array implementations vs pandas references."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from strats import helpers
+from strats.helpers import (
+    adaptive_ma,
+    rolling_last_value_percentile,
+    rolling_mean,
+    rolling_std,
+    wilder_atr,
+    wilder_smooth,
+)
+
+
+def _random_bars(n: int = 300, seed: int = 7) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 3000.0 + np.cumsum(rng.normal(0.0, 15.0, size=n))
+    spread = np.abs(rng.normal(0.0, 10.0, size=n))
+    return pd.DataFrame(
+        {"high": close + spread, "low": close - spread, "close": close},
+        index=pd.RangeIndex(100, 100 + n),
+    )
+
+
+def test_wilder_atr_matches_pandas_true_range_reference() -> None:
+    bars = _random_bars()
+    bars.loc[150, "close"] = np.nan  # gap bar: TR must skip the NaN term
+
+    prev_close = bars["close"].shift(1)
+    ref_tr = pd.concat(
+        [
+            (bars["high"] - bars["low"]).abs(),
+            (bars["high"] - prev_close).abs(),
+            (bars["low"] - prev_close).abs(),
+        ],
+        axis=1,
+    ).max(axis=1)
+    expected = wilder_smooth(ref_tr.to_numpy(dtype=float), 20)
+
+    result = wilder_atr(bars["high"], bars["low"], bars["close"], period=20)
+
+    assert result.index.equals(bars.index)
+    np.testing.assert_allclose(result.to_numpy(), expected, rtol=0, atol=1e-12, equal_nan=True)
+
+
+def test_numba_kernels_match_python_on_nan_leading_input() -> None:
+    pytest.importorskip("numba")
+
+    close = _random_bars()["close"].to_numpy(copy=True)
+    close[:15] = np.nan
+    close[120] = np.nan
+    sc = np.abs(np.sin(np.arange(len(close)) / 7.0)) * 0.4
+    sc[:25] = np.nan
+    sc[200] = np.nan
+
+    np.testing.assert_allclose(
+        wilder_smooth(close, 20),
+        helpers._wilder_smooth_kernel.py_func(close, 20),
+        rtol=1e-12, equal_nan=True,
+    )
+    np.testing.assert_allclose(
+        adaptive_ma(sc, close),
+        helpers._adaptive_ma_kernel.py_func(sc, close),
+        rtol=1e-12, equal_nan=True,
+    )
+
+
+def test_rolling_last_value_percentile_matches_window_loop() -> None:
+    values = pd.Series(np.round(_random_bars(200)["close"].to_numpy() / 50.0))  # ties
+    values.iloc[[30, 31, 120]] = np.nan
+    window = 20
+
+    arr = values.to_numpy()
+    expected = np.full(len(arr), np.nan)
+    for i in range(window - 1, len(arr)):
+        sample = arr[i - window + 1 : i + 1]
+        if np.isnan(sample).any():
+            continue
+        expected[i] = ((sample < sample[-1]).sum() + 0.5 * (sample == sample[-1]).sum()) / window
+
+    result = rolling_last_value_percentile(values, window)
+
+    np.testing.assert_array_equal(result.to_numpy(), expected)
+    assert rolling_last_value_percentile(values.iloc[:5], window).isna().all()
+
+
+def test_rolling_mean_and_std_match_pandas_full_window() -> None:
+    close = _random_bars()["close"]
+    close.iloc[[10, 200]] = np.nan
+
+    np.testing.assert_allclose(
+        rolling_mean(close, 20).to_numpy(),
+        close.rolling(20, min_periods=20).mean().to_numpy(),
+        rtol=1e-12, equal_nan=True,
+    )
+    np.testing.assert_allclose(
+        rolling_std(close, 20, ddof=0).to_numpy(),
+        close.rolling(20, min_periods=20).std(ddof=0).to_numpy(),
+        rtol=1e-9, equal_nan=True,
+    )
+
+
+def test_rolling_mean_and_std_bottleneck_path_matches_pandas(monkeypatch) -> None:
+    bn = pytest.importorskip("bottleneck")
+    monkeypatch.setattr(helpers, "_bn", bn)
+    close = _random_bars()["close"]
+    close.iloc[[10, 200]] = np.nan
+
+    np.testing.assert_allclose(
+        rolling_mean(close, 20).to_numpy(),
+        close.rolling(20, min_periods=20).mean().to_numpy(),
+        rtol=1e-12, equal_nan=True,
+    )
+    for ddof in (0, 1):
+        np.testing.assert_allclose(
+            rolling_std(close, 20, ddof=ddof).to_numpy(),
+            close.rolling(20, min_periods=20).std(ddof=ddof).to_numpy(),
+            rtol=1e-9, equal_nan=True,
+        )
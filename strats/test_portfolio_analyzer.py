@@ -0,0 +1,61 @@
+"""PortfolioAnalyzer metrics on hand-built portfolio_daily frames."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+
+from strats.helpers import PortfolioAnalyzer
+
+
+def _analyzer(equity, trades: pd.DataFrame = None) -> PortfolioAnalyzer:
+    pdf = pd.DataFrame({
+        "date": pd.bdate_range("2024-01-01", periods=len(equity)),
+        "equity": [float(x) for x in equity],
+    })
+    result = SimpleNamespace(portfolio_daily=pdf, trades=trades if trades is not None else pd.DataFrame())
+    return PortfolioAnalyzer(result, config=None)
+
+
+def test_drawdown_episodes_recovered_and_open() -> None:
+    eps = _analyzer([100, 90, 80, 80, 100, 110, 105, 99, 104]).drawdown_episodes()
+
+    assert len(eps) == 2
+    first, second = eps.iloc[0], eps.iloc[1]
+    assert first["start_date"] == pd.Timestamp("2024-01-02")
+    assert first["trough_date"] == pd.Timestamp("2024-01-03")  # first of the two 80s
+    assert first["recovery_date"] == pd.Timestamp("2024-01-05")
+    assert first["max_drawdown_pct"] == pytest.approx(-0.2)
+    assert first["duration_days"] == 3
+
+    assert second["trough_date"] == pd.Timestamp("2024-01-10")
+    assert pd.isna(second["recovery_date"])
+    assert second["max_drawdown_pct"] == pytest.approx(-0.1)
+    assert second["duration_days"] == (pd.Timestamp("2024-01-11") - pd.Timestamp("2024-01-09")).days
+
+
+def test_drawdown_episodes_empty_when_never_underwater() -> None:
+    assert _analyzer([100, 101, 102]).drawdown_episodes().empty
+
+
+def test_summary_stats_trade_metrics() -> None:
+    trades = pd.DataFrame({
+        "net_pnl": [300.0, -100.0, 0.0, 100.0],
+        "r_multiple": [3.0, -1.0, 0.0, 1.0],
+    })
+    stats = _analyzer([100, 101, 102], trades).summary_stats()
+
+    assert stats["total_trades"] == 4
+    assert stats["win_rate"] == pytest.approx(0.5)
+    assert stats["profit_factor"] == pytest.approx(4.0)
+    assert stats["expectancy"] == pytest.approx(75.0)
+
+
+def test_summary_stats_profit_factor_inf_without_losses() -> None:
+    trades = pd.DataFrame({"net_pnl": [50.0, 25.0], "r_multiple": [1.0, 0.5]})
+    stats = _analyzer([100, 101, 102], trades).summary_stats()
+
+    assert stats["win_rate"] == 1.0
+    assert stats["profit_factor"] == float("inf")
@@ -0,0 +1,88 @@
+"""Reusing prepared frames across runs (parameter sweeps)."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from strats.engine import EngineConfig, StrategyEngine, StrategySlot
+from strats.entries.double_ma_entry import DoubleMaEntryConfig, DoubleMaEntryStrategy
+from strats.exits.atr_trail_exit import AtrTrailExitConfig, AtrTrailExitStrategy
+from strats.exits.term_exit import TermExitConfig, TermExitStrategy
+
+
+def _bars(n: int = 160) -> pd.DataFrame:
+    rng = np.random.default_rng(3)
+    frames = []
+    for symbol, base in (("A", 3000.0), ("B", 500.0)):
+        close = base + np.cumsum(rng.normal(0.0, base * 0.01, size=n))
+        frames.append(pd.DataFrame({
+            "date": pd.bdate_range("2023-01-02", periods=n),
+            "symbol": symbol,
+            "open": close, "high": close * 1.01, "low": close * 0.99, "close": close,
+            "volume": 1000.0, "open_interest": 5000.0,
+            "contract_multiplier": 10.0, "commission": 5.0, "slippage": 1.0,
+            "group_name": "G",
+        }))
+    return pd.concat(frames, ignore_index=True)
+
+
+def _cfg() -> EngineConfig:
+    return EngineConfig(
+        initial_capital=1_000_000.0,
+        atr_period=5, adx_period=5,
+        risk_per_trade=0.01, stop_atr_mult=2.0,
+        portfolio_risk_cap=1.0,
+        group_risk_cap={"G": 1.0}, default_group_risk_cap=1.0,
+        independent_group_soft_cap=1.0, risk_blowout_cap=float("inf"),
+        allow_short=True,
+    )
+
+
+@pytest.mark.parametrize(
+    "exit_strategy",
+    [AtrTrailExitStrategy(AtrTrailExitConfig(atr_mult=3.0)), TermExitStrategy(TermExitConfig())],
+)
+def test_run_with_reused_prepared_frame_matches_fresh_run(exit_strategy) -> None:
+    bars = _bars()
+    entry = DoubleMaEntryStrategy(DoubleMaEntryConfig(fast=5, slow=20, allow_short=True))
+    prep_engine = StrategyEngine(config=_cfg(), strategies=[StrategySlot("prep", entry, exit_strategy)])
+    prepared = prep_engine.prepare_strategies(bars)["prep"]
+
+    engine = StrategyEngine(config=_cfg(), strategies=[StrategySlot("combo", entry, exit_strategy)])
+    fresh = engine.run(bars)
+    reused = engine.run(bars, prepared_by_strategy={"combo": prepared})
+
+    assert len(fresh.trades) > 0
+    pd.testing.assert_frame_equal(fresh.trades, reused.trades)
+    pd.testing.assert_frame_equal(fresh.portfolio_daily, reused.portfolio_daily)
+
+
+def test_run_rejects_prepared_frames_for_unknown_slots() -> None:
+    entry = DoubleMaEntryStrategy(DoubleMaEntryConfig(fast=5, slow=20))
+    engine = StrategyEngine(
+        config=_cfg(),
+        strategies=[StrategySlot("combo", entry, TermExitStrategy(TermExitConfig()))],
+    )
+    with pytest.raises(ValueError, match="combo"):
+        engine.run(_bars(), prepared_by_strategy={"other": pd.DataFrame()})
+
+
+def test_shared_base_frames_match_fresh_preparation() -> None:
+    bars = _bars()
+    exit_strategy = TermExitStrategy(TermExitConfig())
+    slots = [
+        StrategySlot("fast", DoubleMaEntryStrategy(DoubleMaEntryConfig(fast=3, slow=10)), exit_strategy),
+        StrategySlot("slow", DoubleMaEntryStrategy(DoubleMaEntryConfig(fast=8, slow=30)), exit_strategy),
+    ]
+    engine = StrategyEngine(config=_cfg(), strategies=slots)
+    base_frames = engine.prepare_base(bars)
+
+    fresh = engine.prepare_strategies(bars)
+    shared = engine.prepare_strategies(bars, base_frames=base_frames)
+
+    for sid in ("fast", "slow"):
+        pd.testing.assert_frame_equal(fresh[sid], shared[sid])
+    # Entry strategies must not mutate the shared base frames.
+    assert "entry_trigger_pass" not in base_frames[0].columns